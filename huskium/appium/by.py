@@ -24,3 +24,6 @@ class ByAttr:
 
     OPTIONAL_VALUES = VALUES + [None]
     """A list of all `By` attribute values with `None`."""
+
+    OPTIONAL_VALUES_SET = frozenset(v for v in OPTIONAL_VALUES if isinstance(v, str | None))
+    """A frozenset of the `OPTIONAL_VALUES` locator strings for O(1) membership checks."""
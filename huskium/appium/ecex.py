@@ -44,7 +44,7 @@ class ECEX(GenericECEX[WebDriver, WebElement]):
         Args:
             switch: Switch to the `WEBVIEW` context
                 when it exists and `switch` is `True`.
-            index: Switch to the specified context index,
+            index: Switch to the specified `WEBVIEW` context index,
                 defaulting to the most recently appeared.
 
         Returns:
@@ -54,11 +54,16 @@ class ECEX(GenericECEX[WebDriver, WebElement]):
         """
 
         def _predicate(driver: WebDriver):
-            contexts = driver.contexts
-            if any('WEBVIEW' in context for context in contexts):
-                if switch:
-                    driver.switch_to.context(contexts[index])
+            # Single pass over the contexts per polling iteration.
+            webviews = [context for context in driver.contexts if 'WEBVIEW' in context]
+            if not webviews:
+                return False
+            if not switch:
                 return driver.context
-            return False
+            target = webviews[index]
+            # Skip the switch round-trip when the target is already active.
+            if driver.context != target:
+                driver.switch_to.context(target)
+            return target
 
         return _predicate
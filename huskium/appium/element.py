@@ -6,10 +6,13 @@
 
 from __future__ import annotations
 
-from typing import Any, cast, Self
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, NamedTuple, Self
 
 from appium.webdriver.webdriver import WebDriver
 from appium.webdriver.webelement import WebElement
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
 
 from ..selenium import ELEMENT_REFERENCE_EXCEPTIONS, GenericElement
 from ..common import Area, Offset
@@ -18,12 +21,90 @@ from .by import ByAttr
 from .page import Page
 
 
+GEOMETRY_CACHE_TTL = 0.25
+"""
+Lifetime in seconds of the client-side `location_in_view` cache.
+Element geometry is stable between scrolls, so repeated reads within
+this window are served from memory instead of a new Appium round-trip.
+"""
+
+MAX_VIEWABLE_TIMEOUT = 20
+"""
+Upper bound in seconds for each `is_viewable()` wait.
+Per-attempt waits above this usually indicate an app problem
+rather than a slow render, so longer timeouts are clamped.
+"""
+
+FIRST_VIEWABLE_TIMEOUT = 0.2
+"""
+Timeout in seconds for the viewability check before the first swipe or
+flick round. An element that needs swiping is normally absent at that
+point, so the first check fails fast instead of spending the full
+per-round timeout before the first gesture.
+"""
+
+SWIPE_IDLE_TIMEOUT_MS = 500
+"""
+`waitForIdleTimeout` in milliseconds applied while a swipe or flick
+search loop runs. UiAutomator2 waits for the app to idle before each
+source fetch; animated screens never idle, so each `is_viewable()`
+check would otherwise block for the full configured idle timeout
+per round.
+"""
+
+
+class AreaGeom(NamedTuple):
+    """
+    Area critical points for alignment, computed once per `_align_by` call
+    and shared by every `_get_aligned_offset` round.
+    """
+    l: int  # left
+    r: int  # right
+    t: int  # top
+    b: int  # bottom
+    hw: int  # half width
+    hh: int  # half height
+    cx: int  # center x
+    cy: int  # center y
+
+
+def _compute_aligned_offset(
+    geom: AreaGeom,
+    el: int,
+    er: int,
+    et: int,
+    eb: int,
+    min_xycmp: int
+) -> tuple[int, int, int, int] | None:
+    """
+    Pure integer math shared by `Element._get_aligned_offset` and
+    `Elements._aligned_offsets`. Kept at module scope, free of attribute
+    access and logging, so repeated swipe rounds pay only for arithmetic.
+    """
+    # delta = (area - element); the right/bottom delta wins when the
+    # element overflows the area on both sides.
+    dl, dr, dt, db = (geom.l - el), (geom.r - er), (geom.t - et), (geom.b - eb)
+    dx = dr if dr < 0 else dl if dl > 0 else 0
+    dy = db if db < 0 else dt if dt > 0 else 0
+    if dx == dy == 0:
+        return None
+    # clamp components to [min_xycmp, max_cmp], keeping the sign
+    if dx:
+        dx = max(min(abs(dx), geom.hw), min_xycmp) * (1 if dx > 0 else -1)
+    if dy:
+        dy = max(min(abs(dy), geom.hh), min_xycmp) * (1 if dy > 0 else -1)
+    return (geom.cx, geom.cy, (geom.cx + dx), (geom.cy + dy))
+
+
 class Element(GenericElement[WebDriver, WebElement]):
 
+    __slots__ = ('_location_in_view_cache',)
+
     page: Page
 
-    def _verify_by(self, by: Any) -> None:
-        if by not in ByAttr.OPTIONAL_VALUES:
+    def _verify_by(self, by: Any, _valid: frozenset = ByAttr.OPTIONAL_VALUES_SET) -> None:
+        # `_valid` is bound at definition time for LOAD_FAST membership checks.
+        if by not in _valid:
             raise ValueError(f'Invalid "by": "{by}". Use values from "By" (from huskium.appium import By).')
 
     def _verify_descriptor_instance(self, instance: Any) -> None:
@@ -42,17 +123,50 @@ class Element(GenericElement[WebDriver, WebElement]):
         if not isinstance(value, Element):
             raise TypeError(f'Assigned value must be "appium Element", got {type(value).__name__}.')
 
-    def is_viewable(self, timeout: int | float | None = None) -> bool:
+    def is_viewable(
+        self,
+        timeout: int | float | None = None,
+        poll_frequency: int | float | None = None
+    ) -> bool:
         """
         Appium API.
         This method is typically used with swipe-based element searching.
         Checks if the current element is visible on the mobile screen.
+
+        Args:
+            timeout: Maximum wait time in seconds,
+                clamped at `MAX_VIEWABLE_TIMEOUT` (20 s).
+            poll_frequency: Sleep interval between checks in seconds.
+                If `None`, uses the default `0.5`.
         """
-        element = self.wait_present(timeout, False)
-        result = bool(element and element.is_displayed())
+        if timeout is not None and timeout > MAX_VIEWABLE_TIMEOUT:
+            timeout = MAX_VIEWABLE_TIMEOUT
+        element = self.wait_present(timeout, False, poll_frequency)
+        result = element.is_displayed() if element else False
         self._cache_visible_element(element, result)
         return result
 
+    def is_inviewable(
+        self,
+        timeout: int | float | None = None,
+        present: bool = True
+    ) -> bool:
+        """
+        Appium API.
+        The inversion of `is_viewable()`, typically used to wait out
+        spinner-style overlays. Polls for the element to become invisible
+        (or absent with `present=False`) instead of waiting the full
+        timeout budget for a visibility check to fail.
+
+        Args:
+            timeout: Maximum wait time in seconds,
+                clamped at `MAX_VIEWABLE_TIMEOUT` (20 s).
+            present: Specifies whether the element must be present.
+        """
+        if timeout is not None and timeout > MAX_VIEWABLE_TIMEOUT:
+            timeout = MAX_VIEWABLE_TIMEOUT
+        return bool(self.wait_invisible(timeout, present, False))
+
     @property
     def location_in_view(self) -> dict[str, int]:
         """
@@ -60,11 +174,53 @@ class Element(GenericElement[WebDriver, WebElement]):
         Retrieve the location (coordination) of the element
         relative to the view when it is present.
         For example: `{'x': 100, 'y': 250}`.
+        Repeated reads within `GEOMETRY_CACHE_TTL` (250 ms) for the same
+        native element id are served from a client-side cache.
         """
         try:
-            return self.present_caching.location_in_view
+            element = self.present_caching
         except ELEMENT_REFERENCE_EXCEPTIONS:
-            return self.present_element.location_in_view
+            element = self.present_element
+        cache = getattr(self, '_location_in_view_cache', None)
+        now = time.monotonic()
+        if cache and cache[0] == element.id and now < cache[2]:
+            # Copy so callers mutating the result cannot corrupt the cache.
+            return dict(cache[1])
+        try:
+            location = element.location_in_view
+        except ELEMENT_REFERENCE_EXCEPTIONS:
+            element = self.present_element
+            location = element.location_in_view
+        self._location_in_view_cache = (element.id, location, now + GEOMETRY_CACHE_TTL)
+        return dict(location)
+
+    def _clear_geometry_cache(self) -> None:
+        """Drop the location and rect caches after any scroll-like action."""
+        for cache_name in ('_location_in_view_cache', '_rect_cache'):
+            try:
+                delattr(self, cache_name)
+            except AttributeError:
+                pass
+
+    @property
+    def _border_tuple(self) -> tuple[int, int, int, int]:
+        """
+        The element border `(left, right, top, bottom)` as a tuple,
+        built from a single rect fetch without a dict round-trip.
+        """
+        rect = self._fetch_rect()
+        x, y, w, h = rect['x'], rect['y'], rect['width'], rect['height']
+        return (int(x), int(x + w), int(y), int(y + h))
+
+    @property
+    def _center_xy(self) -> tuple[int, int]:
+        """
+        The element center `(x, y)` as a tuple,
+        built from a single rect fetch without a dict round-trip.
+        """
+        rect = self._fetch_rect()
+        x, y, w, h = rect['x'], rect['y'], rect['width'], rect['height']
+        return (int(x + w / 2), int(y + h / 2))
 
     def tap(self, duration: int | None = None) -> Self:
         """
@@ -75,8 +231,7 @@ class Element(GenericElement[WebDriver, WebElement]):
         Args:
             duration: Length of time to tap, in ms.
         """
-        center = cast(list[tuple[int, int]], [tuple(self.center.values())])
-        self.driver.tap(center, duration)
+        self.driver.tap([self._center_xy], duration)
         return self
 
     def app_scroll(self, target: Element, duration: int | None = None) -> Self:
@@ -89,8 +244,8 @@ class Element(GenericElement[WebDriver, WebElement]):
                 Default is 600 ms for W3C spec.
         """
         try:
-            self.driver.scroll(self.present_caching, target.present_caching, duration)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
+            self.driver.scroll(self._resolve_present(), target._resolve_present(), duration)
+        except StaleElementReferenceException:
             self.driver.scroll(self.present_element, target.present_element, duration)
         return self
 
@@ -104,8 +259,8 @@ class Element(GenericElement[WebDriver, WebElement]):
                 the tap and hold in seconds.
         """
         try:
-            self.driver.drag_and_drop(self.present_caching, target.present_caching, pause)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
+            self.driver.drag_and_drop(self._resolve_present(), target._resolve_present(), pause)
+        except StaleElementReferenceException:
             self.driver.drag_and_drop(self.present_element, target.present_element, pause)
         return self
 
@@ -117,7 +272,8 @@ class Element(GenericElement[WebDriver, WebElement]):
         max_round: int = 10,
         max_align: int = 2,
         min_xycmp: int = 100,
-        duration: int = 1000
+        duration: int = 1000,
+        poll_frequency: int | float | None = None
     ) -> Self:
         """
         Appium API.
@@ -137,6 +293,9 @@ class Element(GenericElement[WebDriver, WebElement]):
             duration: Swipe and alignment duration in milliseconds.
                 If too short, it may be mistaken as a click.
                 Should be considered along with `offset` and `min_xycmp`.
+            poll_frequency: Sleep interval between visibility checks
+                in seconds. If `None`, uses the default `0.5`.
+                Lower it on remote grids to reduce per-round idle time.
 
         Examples:
             ::
@@ -183,9 +342,8 @@ class Element(GenericElement[WebDriver, WebElement]):
                 )
 
         """
-        area = self.page._get_area(area)
-        offset = self.page._get_offset(offset, area)
-        self._swipe_by(offset, timeout, max_round, duration)
+        area, offset = self.page._resolve_offset(offset, area)
+        self._swipe_by(offset, timeout, max_round, duration, poll_frequency)
         self._align_by(area, max_align, min_xycmp, duration)
         return self
 
@@ -197,7 +355,8 @@ class Element(GenericElement[WebDriver, WebElement]):
         max_round: int = 10,
         max_align: int = 2,
         min_xycmp: int = 100,
-        duration: int = 1000
+        duration: int = 1000,
+        poll_frequency: int | float | None = None
     ) -> Self:
         """
         Appium API.
@@ -217,6 +376,9 @@ class Element(GenericElement[WebDriver, WebElement]):
             duration: **Alignment** (not flick) duration in milliseconds.
                 If too short, it may be mistaken as a click.
                 Should be considered along with `min_xycmp`.
+            poll_frequency: Sleep interval between visibility checks
+                in seconds. If `None`, uses the default `0.5`.
+                Lower it on remote grids to reduce per-round idle time.
 
         Examples:
             ::
@@ -263,54 +425,90 @@ class Element(GenericElement[WebDriver, WebElement]):
                 )
 
         """
-        area = self.page._get_area(area)
-        offset = self.page._get_offset(offset, area)
-        self._flick_by(offset, timeout, max_round)
+        area, offset = self.page._resolve_offset(offset, area)
+        self._flick_by(offset, timeout, max_round, poll_frequency)
         self._align_by(area, max_align, min_xycmp, duration)
         return self
 
+    @contextmanager
+    def _fast_idle(self) -> Iterator[None]:
+        """
+        Temporarily lower the UiAutomator2 `waitForIdleTimeout` to
+        `SWIPE_IDLE_TIMEOUT_MS` so each `is_viewable()` check in a
+        swipe or flick loop fetches the UI tree without waiting for the
+        app to idle, restoring the original setting afterwards.
+        No-op for drivers without the settings API.
+        """
+        driver = self.driver
+        try:
+            original = driver.get_settings().get('waitForIdleTimeout')
+            driver.update_settings({'waitForIdleTimeout': SWIPE_IDLE_TIMEOUT_MS})
+        except (AttributeError, WebDriverException):
+            yield
+            return
+        try:
+            yield
+        finally:
+            if original is not None:
+                try:
+                    driver.update_settings({'waitForIdleTimeout': original})
+                except WebDriverException:
+                    pass
+
     def _swipe_by(
         self,
         offset: tuple[int, int, int, int],
         timeout: int | float,
         max_round: int,
-        duration: int
+        duration: int,
+        poll_frequency: int | float | None = None
     ) -> int | None:
         if not max_round:
-            self.logger.warning(f'For max_round is {max_round}, no swiping performed.')
+            self.logger.warning('For max_round is %s, no swiping performed.', max_round)
             return None
         self.logger.debug('Start swiping.')
+        swipe = self.driver.swipe  # bound once for the loop
         round = 0
-        while not self.is_viewable(timeout):
-            if round == max_round:
-                self.logger.warning(f'Stop swiping. Element remains not viewable after max {max_round} rounds.\n')
-                return round
-            self.driver.swipe(*offset, duration)
-            round += 1
-            self.logger.debug(f'Swiping round {round} done.\n')
-        self.logger.debug(f'Stop swiping. Element is viewable after {round} rounds.\n')
+        check_timeout = min(timeout, FIRST_VIEWABLE_TIMEOUT)  # fail fast before the first gesture
+        with self._fast_idle():
+            while not self.is_viewable(check_timeout, poll_frequency):
+                if round == max_round:
+                    self.logger.warning('Stop swiping. Element remains not viewable after max %s rounds.\n', max_round)
+                    return round
+                check_timeout = timeout
+                swipe(*offset, duration)
+                self._clear_geometry_cache()
+                round += 1
+                self.logger.debug('Swiping round %s done.\n', round)
+        self.logger.debug('Stop swiping. Element is viewable after %s rounds.\n', round)
         return round
 
     def _flick_by(
         self,
         offset: tuple[int, int, int, int],
         timeout: int | float,
-        max_round: int
+        max_round: int,
+        poll_frequency: int | float | None = None
     ) -> int | None:
         if not max_round:
-            self.logger.warning(f'For max_round is {max_round}, no flicking performed.')
+            self.logger.warning('For max_round is %s, no flicking performed.', max_round)
             return None
         self.logger.debug('Start flicking.')
+        flick = self.driver.flick  # bound once for the loop
         round = 0
-        while not self.is_viewable(timeout):
-            if round == max_round:
-                self.logger.warning(
-                    f'Stop flicking. Element remains not viewable after max {max_round} rounds.\n')
-                return round
-            self.driver.flick(*offset)
-            round += 1
-            self.logger.debug(f'Flicking round {round} done.\n')
-        self.logger.debug(f'Stop flicking. Element is viewable after {round} rounds.\n')
+        check_timeout = min(timeout, FIRST_VIEWABLE_TIMEOUT)  # fail fast before the first gesture
+        with self._fast_idle():
+            while not self.is_viewable(check_timeout, poll_frequency):
+                if round == max_round:
+                    self.logger.warning(
+                        'Stop flicking. Element remains not viewable after max %s rounds.\n', max_round)
+                    return round
+                check_timeout = timeout
+                flick(*offset)
+                self._clear_geometry_cache()
+                round += 1
+                self.logger.debug('Flicking round %s done.\n', round)
+        self.logger.debug('Stop flicking. Element is viewable after %s rounds.\n', round)
         return round
 
     def _align_by(
@@ -322,81 +520,43 @@ class Element(GenericElement[WebDriver, WebElement]):
     ) -> int | None:
 
         if not max_align:
-            self.logger.debug(f'For max_align is {max_align}, no alignment performed.')
+            self.logger.debug('For max_align is %s, no alignment performed.', max_align)
             return None
 
         self.logger.debug('Start aligning.')
 
-        # Area critical points
+        # Area critical points, computed once for all rounds.
         al, at, aw, ah = area  # rect
-        ar, ab = (al + aw), (at + ah)  # right, bottom
         ahw, ahh = int(aw / 2), int(ah / 2)  # half_width, half_height
-        acx, acy = (al + ahw), (at + ahh)  # center_x, center_y
-        area_border = (al, ar, at, ab)
-        self.logger.debug(f'AREA(l, r, t, b) = {area_border}')
-        area_halfwh = (ahw, ahh)
-        self.logger.debug(f'AREA(hw, hh) = {area_halfwh}')
-        area_center = (acx, acy)
-        self.logger.debug(f'AREA(cx, cy) = {area_center}')
+        geom = AreaGeom(al, (al + aw), at, (at + ah), ahw, ahh, (al + ahw), (at + ahh))
+        self.logger.debug('AREA(l, r, t, b, hw, hh, cx, cy) = %s', tuple(geom))
 
+        swipe = self.driver.swipe  # bound once for the loop
         round = 0
-        while (aligned_offset := self._get_aligned_offset(area_border, area_halfwh, area_center, min_xycmp)):
+        while (aligned_offset := self._get_aligned_offset(geom, min_xycmp)):
             if round == max_align:
-                self.logger.debug(f'Stop aligning after max {max_align} rounds.\n')
+                self.logger.debug('Stop aligning after max %s rounds.\n', max_align)
                 return round
-            self.driver.swipe(*aligned_offset, duration)
+            swipe(*aligned_offset, duration)
+            self._clear_geometry_cache()
             round += 1
-            self.logger.debug(f'Aligning round {round} done.\n')
-        self.logger.debug(f'Stop aligning after {round} round.\n')
+            self.logger.debug('Aligning round %s done.\n', round)
+        self.logger.debug('Stop aligning after %s round.\n', round)
         return round
 
     def _get_aligned_offset(
         self,
-        area_border: tuple[int, int, int, int],
-        area_halfwh: tuple[int, int],
-        area_center: tuple[int, int],
+        geom: AreaGeom,
         min_xycmp: int,
     ) -> tuple[int, int, int, int] | None:
 
-        # area critical points
-        al, ar, at, ab = area_border
-        max_xcmp, max_ycmp = area_halfwh
-        oex, oey = acx, acy = area_center
-
-        # element border
-        element_border = el, er, et, eb = tuple(self.border.values())
-        self.logger.debug(f'ELEMENT(l, r, t, b) = {(element_border)}')
-
-        # delta = (area - element)
-        delta_border = dl, dr, dt, db = (al - el), (ar - er), (at - et), (ab - eb)
-        self.logger.debug(f'DELTA(l, r, t, b) = {delta_border}')
-
-        # align action = (l>0, r<0, t>0, b<0)
-        align = align_dl, align_dr, align_dt, align_db = (dl > 0), (dr < 0), (dt > 0), (db < 0)
-        self.logger.debug(f'ALIGN(l>0, r<0, t>0, b<0) = {align}')
-
-        # update delta with min_distance
-        if align_dl:
-            dl = max(min(dl, max_xcmp), min_xycmp)  # max_xcmp >= dl >= min_xycmp > 0
-            oex = acx + dl
-            self.logger.debug(f'O(ex) = A(cx) + D{[min_xycmp, max_xcmp]}(l) = {acx} + {dl} = {oex}')
-        if align_dr:
-            dr = min(max(dr, -max_xcmp), -min_xycmp)  # 0 > -min_xycmp >= dr >= -max_xcmp
-            oex = acx + dr
-            self.logger.debug(f'O(ex) = A(cx) + D{[-min_xycmp, -max_xcmp]}(r) = {acx} + {dr} = {oex}')
-        if align_dt:
-            dt = max(min(dt, max_ycmp), min_xycmp)  # max_ycmp >= dt >= min_xycmp > 0
-            oey = acy + dt
-            self.logger.debug(f'O(ey) = A(cy) + D{[min_xycmp, max_ycmp]}(t) = {acy} + {dt} = {oey}')
-        if align_db:
-            db = min(max(db, -max_ycmp), -min_xycmp)  # 0 > -min_xycmp >= db >= -max_ycmp
-            oey = acy + db
-            self.logger.debug(f'O(ey) = A(cy) + D{[-min_xycmp, -max_ycmp]}(b) = {acy} + {db} = {oey}')
-
-        # check if adjustment is needed
-        if (oex, oey) == area_center:
+        el, er, et, eb = self._border_tuple
+        offset = _compute_aligned_offset(geom, el, er, et, eb, min_xycmp)
+        if offset is None:
             self.logger.debug('All the element border is in Area, no alignment required.')
             return None
-        offset = (acx, acy, oex, oey)
-        self.logger.debug(f'OFFSET(sx, sy, ex, ey) = {offset}')
+        self.logger.debug(
+            'ELEMENT(l, r, t, b) = %s; OFFSET(sx, sy, ex, ey) = %s',
+            (el, er, et, eb), offset
+        )
         return offset
@@ -12,22 +12,46 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from selenium.common.exceptions import WebDriverException
 from appium.webdriver.webdriver import WebDriver
 from appium.webdriver.webelement import WebElement
 
 from ..selenium import GenericElements
 from .by import ByAttr
+from .element import AreaGeom, _compute_aligned_offset
 from .page import Page
 
 
+LOCATION_FETCH_MAX_WORKERS = 8
+"""
+The maximum number of threads used to overlap per-element location
+requests when the single-script fetch is unavailable. Each request is an
+independent, IO-bound HTTP round-trip, so overlapping them cuts the wall
+time roughly by the worker count. Set to `1` to force sequential fetches
+if the remote end cannot handle concurrent requests on one session.
+"""
+
+
+_LOCATIONS_IN_VIEW_SCRIPT = (
+    'return Array.prototype.map.call(arguments, function (element) {'
+    ' var rect = element.getBoundingClientRect();'
+    ' return {x: Math.round(rect.left), y: Math.round(rect.top)};'
+    '});'
+)
+
+
 class Elements(GenericElements[WebDriver, WebElement]):
 
+    __slots__ = ()
+
     page: Page
 
-    def _verify_by(self, by: Any) -> None:
-        if by not in ByAttr.OPTIONAL_VALUES:
+    def _verify_by(self, by: Any, _valid: frozenset = ByAttr.OPTIONAL_VALUES_SET) -> None:
+        # `_valid` is bound at definition time for LOAD_FAST membership checks.
+        if by not in _valid:
             raise ValueError(f'Invalid "by": "{by}". Use values from "By" (from huskium.appium import By).')
 
     def _verify_descriptor_instance(self, instance: Any) -> None:
@@ -51,5 +75,38 @@ class Elements(GenericElements[WebDriver, WebElement]):
         """
         Appium API.
         The locations relative to the view of all present elements.
+        Fetches all locations in a single script round-trip when the
+        current context supports JavaScript (e.g. WEBVIEW); otherwise,
+        falls back to per-element requests, overlapped across up to
+        `LOCATION_FETCH_MAX_WORKERS` threads.
+        """
+        elements = self.all_present_elements
+        try:
+            return self.driver.execute_script(_LOCATIONS_IN_VIEW_SCRIPT, *elements)
+        except WebDriverException:
+            workers = min(LOCATION_FETCH_MAX_WORKERS, len(elements))
+            if workers < 2:
+                return [element.location_in_view for element in elements]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(lambda element: element.location_in_view, elements))
+
+    def _aligned_offsets(
+        self,
+        area: tuple[int, int, int, int],
+        min_xycmp: int = 100
+    ) -> list[tuple[int, int, int, int] | None]:
+        """
+        The batched variant of `Element._get_aligned_offset`.
+        Computes the aligning offset of every present element against the
+        absolute `area` rect in one pass, sharing a single area-geometry
+        computation. `None` entries need no alignment.
         """
-        return [element.location_in_view for element in self.all_present_elements]
+        al, at, aw, ah = area
+        ahw, ahh = int(aw / 2), int(ah / 2)
+        geom = AreaGeom(al, (al + aw), at, (at + ah), ahw, ahh, (al + ahw), (at + ahh))
+        offsets: list[tuple[int, int, int, int] | None] = []
+        for rect in self.rects:
+            el, et = rect['x'], rect['y']
+            er, eb = (el + rect['width']), (et + rect['height'])
+            offsets.append(_compute_aligned_offset(geom, el, er, et, eb, min_xycmp))
+        return offsets
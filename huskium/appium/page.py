@@ -6,7 +6,8 @@
 
 from __future__ import annotations
 
-from typing import Any, cast, Literal, Self
+import time
+from typing import Any, Literal, Self
 
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.action_chains import ActionChains
@@ -16,18 +17,88 @@ from selenium.webdriver.common.actions.pointer_input import PointerInput
 from appium.webdriver.webdriver import WebDriver
 from appium.webdriver.webelement import WebElement
 
-from ..common import Area, Offset
+from ..common import Area, Offset, _INT_FLOAT
 from ..selenium import GenericPage
 from ..types import Coordinate, TupleCoordinate
 from .ecex import ECEX
 
 
+_TRUSTED_COORDS = frozenset(id(constant) for constant in Offset._constants() + Area._constants())
+"""
+The `id()`s of the predefined `Offset`/`Area` tuples. These constants
+are known valid, so `_get_coordinate` skips validation on an identity
+hit — a single pointer compare for the common default inputs.
+"""
+
+FLICK_DURATION = 100
+"""
+Pointer move duration in milliseconds used when batched `flick_by`
+builds its W3C action sequence; short enough to register as a flick.
+"""
+
+WINDOW_RECT_CACHE_TTL = 0
+"""
+Default lifetime in seconds of the cached window rect used by relative
+`area` and `offset` resolution. `0` disables caching, since a rotation
+or resize done through the raw driver cannot be detected and would
+reuse a stale rect. The window rect only changes on rotation or
+resize, so pages that control those transitions can opt in via
+`page.window_rect_ttl` to let repeated `swipe_by`/`flick_by` calls
+skip one round-trip each.
+"""
+
+
 class Page(GenericPage[WebDriver, WebElement]):
 
     def _verify_driver(self, driver: Any) -> None:
         if not isinstance(driver, WebDriver):
             raise TypeError(f'The "driver" must be "appium WebDriver", got {type(driver).__name__}.')
 
+    @property
+    def window_rect_ttl(self) -> int | float:
+        """
+        Lifetime in seconds of the cached window rect for this page.
+        Defaults to `WINDOW_RECT_CACHE_TTL` (`0`, caching off); set a
+        positive TTL to opt in, or `None` to restore the default.
+        """
+        return getattr(self, '_window_rect_ttl', WINDOW_RECT_CACHE_TTL)
+
+    @window_rect_ttl.setter
+    def window_rect_ttl(self, ttl: int | float | None) -> None:
+        if ttl is None:
+            vars(self).pop('_window_rect_ttl', None)
+            return
+        if not isinstance(ttl, _INT_FLOAT):
+            raise TypeError(f'The "window_rect_ttl" must be "int" or "float", got {type(ttl).__name__}.')
+        self._window_rect_ttl = ttl
+
+    def _get_cached_window_rect(self) -> dict:
+        """The window rect, cached for `window_rect_ttl` seconds."""
+        ttl = self.window_rect_ttl
+        cache = getattr(self, '_window_rect_cache', None)
+        now = time.monotonic()
+        if ttl > 0 and cache and now < cache[1]:
+            return cache[0]
+        rect = self.get_window_rect()
+        self._window_rect_cache = (rect, now + ttl)
+        return rect
+
+    def refresh_window_rect(self) -> dict:
+        """
+        Drop the cached window rect and refetch it. Call this after an
+        explicit orientation or window change to avoid waiting out the TTL.
+        """
+        self._drop_window_rect_cache()
+        return self._get_cached_window_rect()
+
+    def _drop_window_rect_cache(self) -> None:
+        """
+        Invalidate the cached window rect and the offsets resolved from
+        it, e.g. on a context switch.
+        """
+        vars(self).pop('_window_rect_cache', None)
+        vars(self).pop('_offset_cache', None)
+
     def tap(
         self,
         positions: list[tuple[int, int]],
@@ -52,6 +123,17 @@ class Page(GenericPage[WebDriver, WebElement]):
         self.driver.tap(positions, duration)
         return self
 
+    def _window_center_xy(self) -> tuple[int, int]:
+        """
+        The window center `(x, y)` as a tuple,
+        computed from the cached window rect without a dict round-trip.
+        """
+        rect = self._get_cached_window_rect()
+        return (
+            int(rect['x'] + rect['width'] / 2),
+            int(rect['y'] + rect['height'] / 2)
+        )
+
     def tap_window_center(self, duration: int | None = None) -> Self:
         """
         Tap window center coordination.
@@ -59,8 +141,7 @@ class Page(GenericPage[WebDriver, WebElement]):
         Args:
             duration: length of time to tap, in ms. Default value is 100 ms.
         """
-        center = cast(list[tuple[int, int]], [tuple(self.get_window_center().values())])
-        self.driver.tap(center, duration)
+        self.driver.tap([self._window_center_xy()], duration)
         return self
 
     def swipe(
@@ -97,7 +178,8 @@ class Page(GenericPage[WebDriver, WebElement]):
         offset: Coordinate = Offset.UP,
         area: Coordinate = Area.FULL,
         duration: int = 1000,
-        times: int = 1
+        times: int = 1,
+        batched: bool = True
     ) -> Self:
         """
         Swipe from one point to another,
@@ -110,6 +192,9 @@ class Page(GenericPage[WebDriver, WebElement]):
                 taken to swipe from point A to point B, in milliseconds.
                 The default is set to 250 by ActionBuilder.
             times: The number of times to perform the swipe.
+            batched: If True, chains all `times` swipes into one W3C
+                action sequence, a single round-trip instead of one per
+                swipe. Set `False` to issue separate `swipe` commands.
 
         Examples:
             ::
@@ -157,10 +242,14 @@ class Page(GenericPage[WebDriver, WebElement]):
                 my_page.swipe_by((0.3, 0.85, 0.5, 0.35), (100, 150, 300, 700))
 
         """
-        area = self._get_area(area)
-        offset = self._get_offset(offset, area)
-        for _ in range(times):
-            self.driver.swipe(*offset, duration)
+        area, offset = self._resolve_offset(offset, area)
+        if batched:
+            self._perform_batched_offset(offset, times, duration)
+        else:
+            start_x, start_y, end_x, end_y = offset
+            swipe = self.driver.swipe  # bound once for the loop
+            for _ in range(times):
+                swipe(start_x, start_y, end_x, end_y, duration)
         return self
 
     def flick(
@@ -193,7 +282,8 @@ class Page(GenericPage[WebDriver, WebElement]):
         self,
         offset: Coordinate = Offset.UP,
         area: Coordinate = Area.FULL,
-        times: int = 1
+        times: int = 1,
+        batched: bool = True
     ) -> Self:
         """
         Flick from one point to another,
@@ -203,6 +293,10 @@ class Page(GenericPage[WebDriver, WebElement]):
             offset: Please refer to the Examples.
             area: Please refer to the Examples.
             times: The number of times to perform the flick.
+            batched: If True, chains all `times` flicks into one W3C
+                action sequence (fast `FLICK_DURATION` moves), a single
+                round-trip instead of one per flick. Set `False` to
+                issue separate `flick` commands.
 
         Examples:
             ::
@@ -250,73 +344,141 @@ class Page(GenericPage[WebDriver, WebElement]):
                 my_page.flick_by((0.3, 0.85, 0.5, 0.35), (100, 150, 300, 700))
 
         """
-        area = self._get_area(area)
-        offset = self._get_offset(offset, area)
-        for _ in range(times):
-            self.driver.flick(*offset)
+        area, offset = self._resolve_offset(offset, area)
+        if batched:
+            self._perform_batched_offset(offset, times, FLICK_DURATION)
+        else:
+            start_x, start_y, end_x, end_y = offset
+            flick = self.driver.flick  # bound once for the loop
+            for _ in range(times):
+                flick(start_x, start_y, end_x, end_y)
         return self
 
+    def _perform_batched_offset(
+        self,
+        offset: tuple[int, int, int, int],
+        times: int,
+        duration: int
+    ) -> None:
+        """
+        Chain `times` press-move-release gestures over `offset` into a
+        single W3C action sequence, performed in one round-trip.
+        """
+        start_x, start_y, end_x, end_y = offset
+        touch_input = PointerInput(interaction.POINTER_TOUCH, 'touch')
+        actions = ActionChains(self.driver)
+        actions.w3c_actions = ActionBuilder(self.driver, mouse=touch_input, duration=duration)
+        pointer = actions.w3c_actions.pointer_action
+        for _ in range(times):
+            # Reposition instantly; only the drag move spends `duration`.
+            pointer.source.create_pointer_move(duration=0, x=start_x, y=start_y, origin='viewport')
+            pointer.pointer_down()
+            pointer.move_to_location(end_x, end_y)
+            pointer.pointer_up()
+            pointer.pause(0.05)
+        actions.perform()
+
+    def _resolve_offset(
+        self,
+        offset: Coordinate,
+        area: Coordinate
+    ) -> tuple[tuple[int, int, int, int], tuple[int, int, int, int]]:
+        """
+        Resolve the final absolute `(area, offset)` pair.
+        Relative tuple constants (e.g. the default `Offset.UP` + `Area.FULL`)
+        are memoized per window rect, so the common `swipe_by()` call skips
+        validation and scaling after the first resolution.
+        """
+        key = None
+        if type(offset) is tuple and type(area) is tuple and area and isinstance(area[0], float):
+            rect = self._get_cached_window_rect()
+            rect_key = (rect['x'], rect['y'], rect['width'], rect['height'])
+            if id(offset) in _TRUSTED_COORDS and id(area) in _TRUSTED_COORDS:
+                # The predefined constants live for the whole process, so
+                # their ids are stable and cheaper to hash than 8 floats.
+                key = (id(offset), id(area), rect_key)
+            else:
+                key = (offset, area, rect_key)
+            cached = getattr(self, '_offset_cache', {}).get(key)
+            if cached:
+                return cached
+        # Fused miss path: both coordinates validated and scaled here,
+        # with at most one window rect fetch.
+        area_x, area_y, area_width, area_height = self._get_coordinate(area, 'area')
+        start_x, start_y, end_x, end_y = self._get_coordinate(offset, 'offset')
+        if type(area_x) is float:
+            window_x, window_y, window_width, window_height = self._get_cached_window_rect().values()
+            area_x = int(window_x + window_width * area_x)
+            area_y = int(window_y + window_height * area_y)
+            area_width = int(window_width * area_width)
+            area_height = int(window_height * area_height)
+        if type(start_x) is float:
+            start_x = int(area_x + area_width * start_x)
+            start_y = int(area_y + area_height * start_y)
+            end_x = int(area_x + area_width * end_x)
+            end_y = int(area_y + area_height * end_y)
+        resolved_area = (area_x, area_y, area_width, area_height)
+        resolved_offset = (start_x, start_y, end_x, end_y)
+        self.logger.debug('AREA(x, y, w, h) = %s', resolved_area)
+        self.logger.debug('OFFSET(sx, sy, ex, ey) = %s\n', resolved_offset)
+        if key is not None:
+            cache = getattr(self, '_offset_cache', None)
+            if cache is None or len(cache) > 32:
+                cache = self._offset_cache = {}
+            cache[key] = (resolved_area, resolved_offset)
+        return resolved_area, resolved_offset
+
     def _get_coordinate(
         self,
         coordinate: Coordinate,
         name: str
     ) -> TupleCoordinate:
 
+        # The predefined constants are known valid; skip all checks.
+        if id(coordinate) in _TRUSTED_COORDS:
+            self.logger.debug('%s origin: %s', name, coordinate)
+            return coordinate
+
         # Check coordinate type.
-        if not isinstance(coordinate, dict | tuple):
-            raise TypeError(f'"{name}" should be dict or tuple.')
         if isinstance(coordinate, dict):
-            coordinate = cast(TupleCoordinate, tuple(coordinate.values()))
+            coordinate = tuple(coordinate.values())
+        elif not isinstance(coordinate, tuple):
+            raise TypeError(f'"{name}" should be dict or tuple.')
 
-        # Check all values in coordinate should be int or float.
-        all_int = all(isinstance(c, int) for c in coordinate)
-        all_float = all(isinstance(c, float) for c in coordinate)
-        invalid_type = not (all_int or all_float)
-        if invalid_type:
+        # Check all values in a single pass: they should be
+        # "all int" or "all float", and floats should be (0 <= x <= 1).
+        # Exact-type checks skip the isinstance MRO walk and correctly
+        # reject bool, which is not a coordinate value.
+        all_int = all_float = all_unit = True
+        for c in coordinate:
+            if type(c) is int:
+                all_float = False
+            elif type(c) is float:
+                all_int = False
+                if not 0 <= abs(c) <= 1:
+                    all_unit = False
+            else:
+                all_int = all_float = False
+                break
+        if not (all_int or all_float):
             raise TypeError(f'All "{name}" values in the tuple must be "all int" or "all float".')
-
-        # If float, all should be (0 <= x <= 1).
-        all_unit = all(0 <= abs(c) <= 1 for c in coordinate)
-        invalid_float_value = all_float and not all_unit
-        if invalid_float_value:
+        if all_float and not all_unit:
             raise ValueError(f'All "{name}" values are floats and should be between "0.0" and "1.0".')
 
-        self.logger.debug(f'{name} origin: {coordinate}')
+        self.logger.debug('%s origin: %s', name, coordinate)
         return coordinate
 
-    def _get_area(self, area: Coordinate) -> tuple[int, int, int, int]:
-
-        area_x, area_y, area_width, area_height = self._get_coordinate(area, 'area')
-
-        if isinstance(area_x, float):
-            window_x, window_y, window_width, window_height = self.get_window_rect().values()
-            area_x = int(window_x + window_width * area_x)
-            area_y = int(window_y + window_height * area_y)
-            area_width = int(window_width * area_width)
-            area_height = int(window_height * area_height)
-
-        area = (area_x, area_y, area_width, area_height)
-        self.logger.debug(f'AREA(x, y, w, h) = {area}')
-        return cast(tuple[int, int, int, int], area)
-
-    def _get_offset(
-        self,
-        offset: Coordinate,
-        area: tuple[int, int, int, int]
-    ) -> tuple[int, int, int, int]:
-
-        start_x, start_y, end_x, end_y = self._get_coordinate(offset, 'offset')
-
-        if isinstance(start_x, float):
-            area_x, area_y, area_width, area_height = area
-            start_x = int(area_x + area_width * start_x)
-            start_y = int(area_y + area_height * start_y)
-            end_x = int(area_x + area_width * end_x)
-            end_y = int(area_y + area_height * end_y)
-
-        offset = (start_x, start_y, end_x, end_y)
-        self.logger.debug(f'OFFSET(sx, sy, ex, ey) = {offset}\n')
-        return cast(tuple[int, int, int, int], offset)
+    @staticmethod
+    def _normalize_dots(
+        dots: list[dict[str, int]] | list[tuple[int, int]]
+    ) -> list[tuple[int, int]]:
+        """
+        Normalize `dots` to `(x, y)` tuples, probing only the first dot
+        for its type instead of scanning the whole list.
+        """
+        if dots and isinstance(dots[0], dict):
+            return [(dot['x'], dot['y']) for dot in dots]
+        return dots
 
     def draw_lines(
         self,
@@ -332,33 +494,35 @@ class Page(GenericPage[WebDriver, WebElement]):
                 or [(100, 100), (200, 300), ...].
             duration: The time taken to draw between two points.
         """
-        self.logger.debug(f'origin dots: {dots}')
-        if isinstance(dots, list) and all(isinstance(dot, dict) for dot in dots):
-            dots = [(dot["x"], dot["y"]) for dot in cast(list[dict[str, int]], dots)]
-        self.logger.debug(f'tuple dots: {dots}')
+        debug = self.logger.debug
+        debug('origin dots: %s', dots)
+        dots = self._normalize_dots(dots)
+        debug('tuple dots: %s', dots)
 
         touch_input = PointerInput(interaction.POINTER_TOUCH, 'touch')
         actions = ActionChains(self.driver)
         actions.w3c_actions = ActionBuilder(self.driver, mouse=touch_input)
 
         # Press first dot, the first action can be executed without duration.
-        self.logger.debug(f'Start drawing {len(dots)} dots.')
+        debug('Start drawing %d dots.', len(dots))
         dot1 = dots[0]
         actions.w3c_actions.pointer_action.move_to_location(*dot1)
         actions.w3c_actions.pointer_action.pointer_down()
-        self.logger.debug(f'dot1 = {dot1}')
+        debug('dot1 = %s', dot1)
 
         # Start drawing.
         if duration < 250:
             duration = 250  # Follow by ActionBuilder duration default value.
         actions.w3c_actions = ActionBuilder(self.driver, mouse=touch_input, duration=duration)
+        pointer = actions.w3c_actions.pointer_action
+        move = pointer.move_to_location  # bound once for the loop
         for index, dot in enumerate(dots[1:], 2):
-            actions.w3c_actions.pointer_action.move_to_location(*dot)
-            self.logger.debug(f'dot{index} = {dot}')
-        self.logger.debug('Drawing done.\n')
+            move(*dot)
+            debug('dot%d = %s', index, dot)
+        debug('Drawing done.\n')
 
         # relase = pointer_up, lift fingers off the screen.
-        actions.w3c_actions.pointer_action.release()
+        pointer.release()
         actions.perform()
 
     def draw_gesture(
@@ -378,37 +542,40 @@ class Page(GenericPage[WebDriver, WebElement]):
             gesture: A string containing the actual positions of the nine dots,
                 such as '1235789' for drawing a Z shape.
         """
-        self.logger.debug(f'origin dots: {dots}')
-        if isinstance(dots, list) and all(isinstance(dot, dict) for dot in dots):
-            dots = [(dot["x"], dot["y"]) for dot in cast(list[dict[str, int]], dots)]
-        self.logger.debug(f'tuple dots: {dots}')
-        self.logger.debug(f'gesture: {gesture}')
+        debug = self.logger.debug
+        debug('origin dots: %s', dots)
+        dots = self._normalize_dots(dots)
+        debug('tuple dots: %s', dots)
+        debug('gesture: %s', gesture)
 
         touch_input = PointerInput(interaction.POINTER_TOUCH, 'touch')
         actions = ActionChains(self.driver)
         actions.w3c_actions = ActionBuilder(self.driver, mouse=touch_input)
 
         # Press first dot, the first action can be executed without duration.
-        self.logger.debug(f'Start drawing {len(gesture)} dots.')
-        indexes = [(int(i) - 1) for i in gesture]
+        debug('Start drawing %d dots.', len(gesture))
+        # ord('1') == 49; cheaper than an int() parse per character.
+        indexes = [(ord(i) - 49) for i in gesture]
         press = indexes[0]
         dot1 = dots[press]
         actions.w3c_actions.pointer_action.move_to_location(*dot1)
         actions.w3c_actions.pointer_action.pointer_down()
-        self.logger.debug(f'dot1 = {dot1}')
+        debug('dot1 = %s', dot1)
 
         # Start drawing.
         if duration < 250:
             duration = 250  # Follow by ActionBuilder duration default value.
         actions.w3c_actions = ActionBuilder(self.driver, mouse=touch_input, duration=duration)
+        pointer = actions.w3c_actions.pointer_action
+        move = pointer.move_to_location  # bound once for the loop
         for index, draw in enumerate(indexes[1:], 2):
             dot = dots[draw]
-            actions.w3c_actions.pointer_action.move_to_location(*dot)
-            self.logger.debug(f'dot{index} = {dot}')
-        self.logger.debug('Drawing done.\n')
+            move(*dot)
+            debug('dot%d = %s', index, dot)
+        debug('Drawing done.\n')
 
         # relase = pointerup, lift fingers off the screen.
-        actions.w3c_actions.pointer_action.release()
+        pointer.release()
         actions.perform()
 
     def get_status(self) -> dict:
@@ -440,6 +607,7 @@ class Page(GenericPage[WebDriver, WebElement]):
         Passing None is equal to switching to native context.
         Returns the current context.
         """
+        self._drop_window_rect_cache()
         self.driver.switch_to.context(context)
         return self.driver.context
 
@@ -466,6 +634,8 @@ class Page(GenericPage[WebDriver, WebElement]):
                 `str` for current context;
                 `False` for no any WEBVIEW in contexts.
         """
+        if switch:
+            self._drop_window_rect_cache()
         try:
             return self.waiting(timeout).until(ECEX.webview_is_present(switch, index))
         except TimeoutException as exc:
@@ -477,6 +647,7 @@ class Page(GenericPage[WebDriver, WebElement]):
         Appium API. Switch to native app.
         Return the current context after judging whether to switch.
         """
+        self._drop_window_rect_cache()
         self.driver.switch_to.context('NATIVE_APP')
         return self.driver.context
 
@@ -505,10 +676,12 @@ class Page(GenericPage[WebDriver, WebElement]):
         Args:
             app_id: The application id to be activated.
         """
+        self._drop_window_rect_cache()
         self.driver.activate_app(app_id)
         return self
 
     def switch_to_flutter(self) -> str:
         """Appium API. Switch to flutter app."""
+        self._drop_window_rect_cache()
         self.driver.switch_to.context('FLUTTER')
         return self.driver.context
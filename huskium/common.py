@@ -4,15 +4,42 @@
 # GitHub: https://github.com/uujohnnyuu/huskium
 
 
+import os
+import sys
+from typing import final
+
+
+DEBUG = os.getenv('HUSKIUM_DEBUG', '0') != '0'
+"""
+Whether to run the per-access descriptor type checks.
+Owner types are always validated once at class creation; set
+`HUSKIUM_DEBUG=1` to also re-check the instance and owner on every
+descriptor access.
+"""
+
+# Tuple forms of the common isinstance unions. The tuple form takes the
+# faster C path in PyObject_IsInstance, with no per-call union handling.
+_STR_OR_NONE = (str, type(None))
+_INT_OR_NONE = (int, type(None))
+_BOOL_OR_NONE = (bool, type(None))
+_INT_FLOAT = (int, float)
+_INT_FLOAT_OR_NONE = (int, float, type(None))
+
+
 class _Name:
     _page = '_page'
     _present_cache = '_present_cache'
     _visible_cache = '_visible_cache'
     _clickable_cache = '_clickable_cache'
     _select_cache = '_select_cache'
-    _caches = [_present_cache, _visible_cache, _clickable_cache, _select_cache]
+    # Interned tuple so _clear_caches loops over a fixed, hashable constant.
+    _caches = tuple(
+        sys.intern(name)
+        for name in (_present_cache, _visible_cache, _clickable_cache, _select_cache)
+    )
 
 
+@final
 class Offset:
     """
     All Offset attributes store `(start_x, start_y, end_x, end_y)`.
@@ -20,6 +47,8 @@ class Offset:
     `swipe_by` and `flick_by`.
     """
 
+    __slots__ = ()
+
     UP: tuple = (0.5, 0.75, 0.5, 0.25)
     """Swipe up (bottom to top)."""
 
@@ -44,7 +73,16 @@ class Offset:
     LOWER_RIGHT: tuple = (0.25, 0.25, 0.75, 0.75)
     """Swipe lower right (upper left to lower right)."""
 
+    @classmethod
+    def _constants(cls) -> tuple[tuple, ...]:
+        """All the predefined coordinate tuples on this class."""
+        return tuple(
+            value for name, value in vars(cls).items()
+            if not name.startswith('__') and isinstance(value, tuple)
+        )
+
 
+@final
 class Area:
     """
     All Area attributes store `(x, y, width, height)`.
@@ -52,5 +90,15 @@ class Area:
     `swipe_by` and `flick_by`.
     """
 
+    __slots__ = ()
+
     FULL: tuple = (0.0, 0.0, 1.0, 1.0)
     """Full window size."""
+
+    @classmethod
+    def _constants(cls) -> tuple[tuple, ...]:
+        """All the predefined coordinate tuples on this class."""
+        return tuple(
+            value for name, value in vars(cls).items()
+            if not name.startswith('__') and isinstance(value, tuple)
+        )
@@ -8,11 +8,13 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any, cast, Iterable, Literal, Self, Type
+from contextlib import contextmanager
+from typing import Any, Callable, cast, Iterable, Iterator, Literal, Self, Type
 
-from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.actions.wheel_input import ScrollOrigin
+from selenium.webdriver.common.utils import keys_to_typing
 from selenium.webdriver.remote.shadowroot import ShadowRoot
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
@@ -22,7 +24,7 @@ from selenium.webdriver.support.select import Select
 from ..exception import NoSuchCacheException
 from ..logging import LogConfig, PageElementLoggerAdapter
 from ..wait import Wait
-from ..common import _Name
+from ..common import DEBUG, _INT_FLOAT_OR_NONE, _INT_OR_NONE, _BOOL_OR_NONE, _STR_OR_NONE, _Name
 from .by import ByAttr
 from .ecex import GenericECEX
 from .page import GenericPage
@@ -30,12 +32,56 @@ from .page import GenericPage
 
 ELEMENT_REFERENCE_EXCEPTIONS = (NoSuchCacheException, StaleElementReferenceException)
 
+# Module-level bindings of the cache attribute names, so the hot cache
+# paths load them with LOAD_GLOBAL instead of a class attribute lookup.
+_PRESENT = _Name._present_cache
+_VISIBLE = _Name._visible_cache
+_CLICKABLE = _Name._clickable_cache
+_SELECT = _Name._select_cache
+_CACHES = _Name._caches + ('_rect_cache', '_state_cache', '_scroll_origin_cache', '_pinned_present')
+
+_CLICKABLE_STATE_SCRIPT = (
+    'var e = arguments[0];'
+    'var s = window.getComputedStyle(e);'
+    'var shown = !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length)'
+    " && s.visibility === 'visible' && parseFloat(s.opacity) !== 0;"
+    'return [shown, !e.disabled];'
+)
+"""
+Returns `[displayed, enabled]` in one script call, so `is_clickable`
+costs a single driver round-trip instead of the
+`is_displayed()` + `is_enabled()` pair. The layout check is combined
+with computed visibility and opacity to match the `is_displayed()`
+atom for hidden and fully transparent elements.
+"""
+
+RECT_CACHE_TTL = 0.05
+"""
+Seconds a fetched element rect is reused by the geometry properties
+(`rect`, `location`, `size`, `border`, `center`). Keeps chained reads
+like `center` followed by `border` to one driver round-trip, while
+staying well under typical animation frame times.
+"""
+
+STATE_CACHE_TTL = 0.1
+"""
+Seconds a computed `is_visible` / `is_clickable` result is reused while
+the cached element is unchanged, sparing hot polling loops the driver
+round-trips per check. `0` disables the reuse.
+"""
+
 LOGGER = logging.getLogger(__name__)
 LOGGER.addFilter(LogConfig.PREFIX_FILTER)
 
 
 class GenericElement[WD: WebDriver, WE: WebElement]:
 
+    __slots__ = (
+        '_by', '_value', '_locator', '_index', '_timeout', '_cache', '_remark', '_logger', '_installed',
+        '_page', '_wait', '_synced_cache', '_ec_cache', '_rect_cache', '_state_cache', '_scroll_origin_cache', '_pinned_present',
+        '_present_cache', '_visible_cache', '_clickable_cache', '_select_cache'
+    )
+
     _page: GenericPage[WD, WE]
     _wait: Wait
     _synced_cache: bool
@@ -90,20 +136,49 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         self._set_data(by, value, index, timeout, cache, remark)
 
     def __get__(self, instance: GenericPage[WD, WE], owner: Type[GenericPage[WD, WE]]) -> Self:
-        """Make "Element" a descriptor of "Page"."""
+        """
+        Make "Element" a descriptor of "Page".
+        Each Page instance gets its own clone of a class-installed
+        Element, so pages no longer share cache state and switching
+        between page objects does not discard valid caches. The clones
+        live on the page and are garbage-collected with it. Ad-hoc
+        elements (the `@dynamic` pattern) are built per call and bind
+        directly, so the page retains nothing for them.
+        """
+        if instance is None:
+            return self
         self._verify_get(instance, owner)
-        if getattr(self, _Name._page, None) is not instance:
-            self._page = instance
-            self._wait = Wait(instance._driver, 1)
-            self._clear_caches()
-        self._sync_data()
-        return self
+        if not getattr(self, '_installed', False):
+            # Ad-hoc elements (the `@dynamic` pattern) are built per
+            # call; bind directly so the page does not retain them.
+            if getattr(self, _Name._page, None) is not instance:
+                self._page = instance
+                self._wait = Wait(instance._driver, 1)
+                self._clear_caches()
+            self._sync_data()
+            return self
+        clones = instance.__dict__.setdefault('_element_clones', {})
+        clone = clones.get(self)
+        if clone is None:
+            clone = self._clone_for(instance)
+            clones[self] = clone
+        clone._sync_data()
+        return clone
 
     def __set__(self, instance: GenericPage[WD, WE], value: GenericElement) -> None:
         """Set dynamic element by `page.element = Element(...)` pattern."""
         self._verify_set(instance, value)
         self._set_data(value._by, value._value, value._index, value._timeout, value._cache, value._remark)
-        self._clear_caches()
+        # The next access rebuilds this page's clone from the new data.
+        instance.__dict__.get('_element_clones', {}).pop(self, None)
+
+    def _clone_for(self, instance: GenericPage[WD, WE]) -> Self:
+        """Build the per-page clone bound to `instance`."""
+        clone = type(self).__new__(type(self))
+        clone._set_data(self._by, self._value, self._index, self._timeout, self._cache, self._remark)
+        clone._page = instance
+        clone._wait = Wait(instance._driver, 1)
+        return clone
 
     def dynamic(
         self,
@@ -149,6 +224,23 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         """
         # Avoid using __init__() here, as it will reset the descriptor.
         self._verify_data(by, value, index, timeout, cache, remark)
+        return self._dynamic_unchecked(by, value, index, timeout, cache, remark)
+
+    def _dynamic_unchecked(
+        self,
+        by: str,
+        value: str,
+        index: int | None = None,
+        timeout: int | float | None = None,
+        cache: bool | None = None,
+        remark: str | None = None
+    ) -> Self:
+        """
+        `dynamic()` without re-validating the args.
+        For framework code that rebuilds elements in bulk from values
+        already known to be well-typed; all other callers should use
+        `dynamic()`.
+        """
         self._set_data(by, value, index, timeout, cache, remark)
         self._sync_data()
         self._clear_caches()
@@ -163,13 +255,18 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         cache: bool | None,
         remark: str | None
     ) -> None:
-        """Verify basic attributes."""
+        """Verify basic attributes with all checks inlined in one frame."""
         self._verify_by(by)
-        self._verify_value(value)
-        self._verify_index(index)
-        self._verify_timeout(timeout)
-        self._verify_cache(cache)
-        self._verify_remark(remark)
+        if not isinstance(value, _STR_OR_NONE):
+            raise TypeError(f'The set "value" must be str, got {type(value).__name__}.')
+        if not isinstance(index, _INT_OR_NONE):
+            raise TypeError(f'The set "index" must be int, got {type(index).__name__}.')
+        if not isinstance(timeout, _INT_FLOAT_OR_NONE):
+            raise TypeError(f'The set "timeout" must be int or float, got {type(timeout).__name__}.')
+        if not isinstance(cache, _BOOL_OR_NONE):
+            raise TypeError(f'The set "cache" must be bool, got {type(cache).__name__}.')
+        if not isinstance(remark, _STR_OR_NONE):
+            raise TypeError(f'The set "remark" must be str, got {type(remark).__name__}.')
 
     def _set_data(
         self,
@@ -183,52 +280,81 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         """Set basic attributes."""
         self._by = by
         self._value = value
+        self._locator = (by, value) if by and value else None
         self._index = index
         self._timeout = timeout
         self._cache = cache
-        self._remark = remark or self.default_remark
-        self._logger = PageElementLoggerAdapter(LOGGER, self)
+        self._remark = remark or None
+        for lazy in ('_logger', '_ec_cache'):
+            try:
+                delattr(self, lazy)
+            except AttributeError:
+                pass
 
     def _sync_data(self) -> None:
         """Synchronize necessary attributes."""
-        self._wait.timeout = self._page._timeout if self._timeout is None else self._timeout
+        # Runs on every descriptor access; both values are already
+        # validated, so skip the property dispatch and write only on change.
+        timeout = self._page._timeout if self._timeout is None else self._timeout
+        if self._wait._timeout != timeout:
+            self._wait._timeout = timeout
         self._synced_cache = type(self)._CACHE if self._cache is None else self._cache
 
+    def _ec(self, factory: Callable[..., Callable], *args: Any) -> Callable:
+        """
+        Return the cached predicate built by
+        `factory(self.locator, self.index, *args)`, building it on first
+        use. Locator-based predicates close only over `(locator, index)`,
+        so they can be reused across waits; `_set_data` drops the cache
+        whenever the locator data changes.
+        """
+        try:
+            cache = self._ec_cache
+        except AttributeError:
+            cache = self._ec_cache = {}
+        key = (factory.__name__, args)
+        predicate = cache.get(key)
+        if predicate is None:
+            predicate = cache[key] = factory(self.locator, self.index, *args)
+        return predicate
+
     def _clear_caches(self) -> None:
         """Clear all caches to prevent wrong element reference issues."""
-        for cache_name in _Name._caches:
-            vars(self).pop(cache_name, None)
+        for cache_name in _CACHES:
+            try:
+                delattr(self, cache_name)
+            except AttributeError:
+                pass
 
-    def _verify_by(self, by: Any) -> None:
-        if by not in ByAttr.OPTIONAL_VALUES:
+    def _verify_by(self, by: Any, _valid: frozenset = ByAttr.OPTIONAL_VALUES_SET) -> None:
+        # `_valid` is bound at definition time for LOAD_FAST membership checks.
+        if by not in _valid:
             raise ValueError(f'Invalid "by": "{by}". Use values from "By" (from huskium.selenium import By).')
 
-    def _verify_value(self, value: Any) -> None:
-        if not isinstance(value, str | None):
-            raise TypeError(f'The set "value" must be str, got {type(value).__name__}.')
-
-    def _verify_index(self, index: Any) -> None:
-        if not isinstance(index, int | None):
-            raise TypeError(f'The set "index" must be int, got {type(index).__name__}.')
-
     def _verify_timeout(self, timeout: Any) -> None:
-        if not isinstance(timeout, int | float | None):
+        if not isinstance(timeout, _INT_FLOAT_OR_NONE):
             raise TypeError(f'The set "timeout" must be int or float, got {type(timeout).__name__}.')
 
-    def _verify_cache(self, cache: Any) -> None:
-        if not isinstance(cache, bool | None):
-            raise TypeError(f'The set "cache" must be bool, got {type(cache).__name__}.')
-
     def _verify_remark(self, remark: Any) -> None:
-        if not isinstance(remark, str | None):
+        if not isinstance(remark, _STR_OR_NONE):
             raise TypeError(f'The set "remark" must be str, got {type(remark).__name__}.')
 
-    def _verify_get(self, instance: Any, owner: Any):
-        self._verify_descriptor_instance(instance)
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Validate the owning class once, at class creation time."""
         self._verify_descriptor_owner(owner)
+        # Only class-installed descriptors keep per-page clones.
+        self._installed = True
+
+    def _verify_get(self, instance: Any, owner: Any):
+        # The owner is already validated by `__set_name__`; re-check the
+        # instance and owner per access only when `HUSKIUM_DEBUG=1`.
+        if DEBUG:
+            self._verify_descriptor_instance(instance)
+            self._verify_descriptor_owner(owner)
 
     def _verify_set(self, instance: Any, value: Any):
-        self._verify_descriptor_instance(instance)
+        if DEBUG:
+            self._verify_descriptor_instance(instance)
         self._verify_descriptor_value(value)
 
     def _verify_descriptor_instance(self, instance: Any) -> None:
@@ -259,9 +385,9 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
 
     @property
     def locator(self) -> tuple[str, str]:
-        """The element locator `(by, value)`"""
-        if self._by and self._value:
-            return (self._by, self._value)
+        """The element locator `(by, value)`, built once at set time."""
+        if self._locator:
+            return self._locator
         raise ValueError('The locator "(by, value)" must be set.')
 
     @property
@@ -300,8 +426,11 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
     def remark(self) -> str | dict:
         """
         The element remark.
-        If not set, defaults to ``{"by": by, "value": value, "index": index}``.
+        If not set, defaults to ``{"by": by, "value": value, "index": index}``,
+        built on first access.
         """
+        if self._remark is None:
+            self._remark = self.default_remark
         return self._remark
 
     @property
@@ -318,12 +447,16 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         defaults to ``{"by": by, "value": value, "index": index}``.
         """
         self._verify_remark(value)
-        self._remark = value or self.default_remark
+        self._remark = value or None
 
     @property
     def logger(self) -> PageElementLoggerAdapter:
-        """The element logger."""
-        return self._logger
+        """The element logger, built on first use."""
+        try:
+            return self._logger
+        except AttributeError:
+            self._logger = PageElementLoggerAdapter(LOGGER, self)
+            return self._logger
 
     @property
     def page(self) -> GenericPage[WD, WE]:
@@ -348,11 +481,13 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
     def waiting(
         self,
         timeout: int | float | None = None,
-        ignored_exceptions: Type[Exception] | Iterable[Type[Exception]] | None = None
+        ignored_exceptions: Type[Exception] | Iterable[Type[Exception]] | None = None,
+        poll_frequency: int | float | None = None
     ) -> Wait:
         """The final WebDriverWait instance."""
         self._wait.timeout = timeout
         self._wait.ignored_exceptions = ignored_exceptions
+        self._wait.poll_frequency = poll_frequency
         return self._wait
 
     def find_element(self) -> WE:
@@ -371,10 +506,99 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         Return `getattr(self, name)`,
         or raise `NoSuchCacheException` if no cache is available.
         """
-        if self.cache and hasattr(self, name):
-            return getattr(self, name)
+        # A single getattr instead of a hasattr probe plus a re-read.
+        if self._synced_cache:
+            try:
+                return getattr(self, name)
+            except AttributeError:
+                pass
         raise NoSuchCacheException(f'No cache for "{name}", please relocate the element in except.')
 
+    def _cached_or_none(self, name: str) -> Any:
+        """
+        Non-raising `_caching`: return `getattr(self, name)`,
+        or `None` if caching is disabled or nothing is cached.
+        Used by the wait methods so a cache miss costs a branch
+        instead of a raised `NoSuchCacheException`.
+        """
+        if self._synced_cache:
+            return getattr(self, name, None)
+        return None
+
+    def _with_stale_retry(self, op: Callable[..., Any], *targets: GenericElement[WD, WE]) -> Any:
+        """
+        Run `op` with the cached present element(s) first; on a cache
+        miss or a stale reference, relocate and run it once more.
+        Replaces the repeated `try: present_caching ...
+        except: present_element` idiom.
+        """
+        try:
+            return op(self.present_caching, *(target.present_caching for target in targets))
+        except ELEMENT_REFERENCE_EXCEPTIONS:
+            return op(self.present_element, *(target.present_element for target in targets))
+
+    def _with_visible_stale_retry(self, op: Callable[[WE], Any]) -> Any:
+        """`_with_stale_retry` against the visible tier."""
+        try:
+            return op(self.visible_caching)
+        except ELEMENT_REFERENCE_EXCEPTIONS:
+            return op(self.visible_element)
+
+    def _with_clickable_stale_retry(self, op: Callable[[WE], Any]) -> Any:
+        """`_with_stale_retry` against the clickable tier."""
+        try:
+            return op(self.clickable_caching)
+        except ELEMENT_REFERENCE_EXCEPTIONS:
+            return op(self.clickable_element)
+
+    def _with_select_stale_retry(self, op: Callable[[Select], Any]) -> Any:
+        """`_with_stale_retry` against the Select wrapper."""
+        try:
+            return op(self.select_caching)
+        except ELEMENT_REFERENCE_EXCEPTIONS:
+            return op(self.select)
+
+    def _resolve_present(self) -> WE:
+        """
+        The present element: pinned if inside `action_batch()`, cached
+        if valid, relocated otherwise. Used by the ActionChains
+        wrappers, which only queue the element into the chain and so
+        cannot raise after resolution.
+        """
+        try:
+            return self._pinned_present
+        except AttributeError:
+            pass
+        try:
+            return self.present_caching
+        except ELEMENT_REFERENCE_EXCEPTIONS:
+            return self.present_element
+
+    @contextmanager
+    def action_batch(self) -> Iterator[WE]:
+        """
+        Pin the resolved present element for the duration of the block,
+        so every ActionChains wrapper inside queues the same WebElement
+        from exactly one resolution.
+
+        Examples:
+            ::
+
+                with page.element.action_batch():
+                    page.element.move_to_element().clicks_on_element()
+                page.element.perform()
+
+        """
+        element = self._resolve_present()
+        self._pinned_present = element
+        try:
+            yield element
+        finally:
+            try:
+                del self._pinned_present
+            except AttributeError:
+                pass
+
     @property
     def present_caching(self) -> WE:
         """
@@ -389,7 +613,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                     self.present_element.text
 
         """
-        return self._caching(_Name._present_cache)
+        return self._caching(_PRESENT)
 
     @property
     def visible_caching(self) -> WE:
@@ -405,7 +629,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                     self.visible_element.text
 
         """
-        return self._caching(_Name._visible_cache)
+        return self._caching(_VISIBLE)
 
     @property
     def clickable_caching(self) -> WE:
@@ -421,7 +645,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                     self.clickable_element.click()
 
         """
-        return self._caching(_Name._clickable_cache)
+        return self._caching(_CLICKABLE)
 
     @property
     def select_caching(self) -> Select:
@@ -437,11 +661,11 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                     self.select.options
 
         """
-        return self._caching(_Name._select_cache)
+        return self._caching(_SELECT)
 
     def _cache_present_element(self, element: WE | Any):
         """Cache the present element if caching is enabled."""
-        if self.cache and isinstance(element, WebElement):
+        if self._synced_cache and isinstance(element, WebElement):
             self._present_cache = cast(WE, element)
 
     def _cache_visible_element(self, element: WE | Any, extra: bool = True):
@@ -449,7 +673,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         Cache the element as present and visible
         if caching is enabled and extra conditions are met.
         """
-        if self.cache and isinstance(element, WebElement) and extra:
+        if self._synced_cache and isinstance(element, WebElement) and extra:
             self._visible_cache = self._present_cache = cast(WE, element)
 
     def _cache_clickable_element(self, element: WE | Any, extra: bool = True):
@@ -457,12 +681,12 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         Cache the element as present, visible, and clickable
         if caching is enabled and extra conditions are met.
         """
-        if self.cache and isinstance(element, WebElement) and extra:
+        if self._synced_cache and isinstance(element, WebElement) and extra:
             self._clickable_cache = self._visible_cache = self._present_cache = cast(WE, element)
 
     def _cache_select(self, select: Select):
         """Cache the Select instance if caching is enabled."""
-        if self.cache and isinstance(select, Select):
+        if self._synced_cache and isinstance(select, Select):
             self._select_cache = select
 
     def _timeout_process(
@@ -485,7 +709,8 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
     def wait_present(
         self,
         timeout: int | float | None = None,
-        reraise: bool | None = None
+        reraise: bool | None = None,
+        poll_frequency: int | float | None = None
     ) -> WE | Literal[False]:
         """
         Waits for the element to become present.
@@ -498,6 +723,8 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 If `None`, follows `page.reraise`.
                 If `True`, raises `TimeoutException`;
                 if `False`, returns `False`.
+            poll_frequency: Sleep interval between checks in seconds.
+                If `None`, uses the default `0.5`.
 
         Returns:
             (WebElement | False):
@@ -509,10 +736,12 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 after the timeout(`reraise=True`).
         """
         try:
-            element = self.waiting(timeout).until(
-                GenericECEX[WD, WE].presence_of_element_located(self.locator, self.index)
+            element = self.waiting(timeout, poll_frequency=poll_frequency).until(
+                self._ec(GenericECEX[WD, WE].presence_of_element_located)
             )
-            self._cache_present_element(element)
+            # until() only returns a truthy WebElement here, so cache inline.
+            if self._synced_cache:
+                self._present_cache = element
             return element
         except TimeoutException as exc:
             return self._timeout_process('present', exc, reraise)
@@ -545,7 +774,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         """
         try:
             return self.waiting(timeout).until(
-                GenericECEX[WD, WE].absence_of_element_located(self.locator, self.index)
+                self._ec(GenericECEX[WD, WE].absence_of_element_located)
             )
         except TimeoutException as exc:
             return self._timeout_process('absent', exc, reraise)
@@ -578,17 +807,21 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 after the timeout(`reraise=True`).
         """
         try:
-            try:
-                self._visible_cache = self.waiting(timeout).until(
-                    GenericECEX[WD, WE].visibility_of_element(self.present_caching)
-                )
-                return self._visible_cache
-            except ELEMENT_REFERENCE_EXCEPTIONS:
-                element = self.waiting(timeout, StaleElementReferenceException).until(
-                    GenericECEX[WD, WE].visibility_of_element_located(self.locator, self.index)
-                )
-                self._cache_visible_element(element)
-                return element
+            cached = self._cached_or_none(_PRESENT)
+            if cached is not None:
+                try:
+                    self._visible_cache = self.waiting(timeout).until(
+                        GenericECEX[WD, WE].visibility_of_element(cached)
+                    )
+                    return self._visible_cache
+                except ELEMENT_REFERENCE_EXCEPTIONS:
+                    pass
+            element = self.waiting(timeout, StaleElementReferenceException).until(
+                self._ec(GenericECEX[WD, WE].visibility_of_element_located)
+            )
+            if self._synced_cache:
+                self._visible_cache = self._present_cache = element
+            return element
         except TimeoutException as exc:
             return self._timeout_process('visible', exc, reraise)
 
@@ -624,19 +857,22 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 after the timeout(`reraise=True`).
         """
         try:
-            try:
-                return cast(
-                    WE | Literal[True],
-                    self.waiting(timeout).until(
-                        GenericECEX[WD, WE].invisibility_of_element(self.present_caching, present)
+            cached = self._cached_or_none(_PRESENT)
+            if cached is not None:
+                try:
+                    return cast(
+                        WE | Literal[True],
+                        self.waiting(timeout).until(
+                            GenericECEX[WD, WE].invisibility_of_element(cached, present)
+                        )
                     )
-                )
-            except ELEMENT_REFERENCE_EXCEPTIONS:
-                element_or_true = self.waiting(timeout, StaleElementReferenceException).until(
-                    GenericECEX[WD, WE].invisibility_of_element_located(self.locator, self.index, present)
-                )
-                self._cache_present_element(element_or_true)
-                return cast(WE | Literal[True], element_or_true)
+                except ELEMENT_REFERENCE_EXCEPTIONS:
+                    pass
+            element_or_true = self.waiting(timeout, StaleElementReferenceException).until(
+                self._ec(GenericECEX[WD, WE].invisibility_of_element_located, present)
+            )
+            self._cache_present_element(element_or_true)
+            return cast(WE | Literal[True], element_or_true)
         except TimeoutException as exc:
             return self._timeout_process('invisible', exc, reraise, present)
 
@@ -668,17 +904,21 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 after the timeout(`reraise=True`).
         """
         try:
-            try:
-                self._clickable_cache = self._visible_cache = self.waiting(timeout).until(
-                    GenericECEX[WD, WE].element_to_be_clickable(self.present_caching)
-                )
-                return self._clickable_cache
-            except ELEMENT_REFERENCE_EXCEPTIONS:
-                element = self.waiting(timeout, StaleElementReferenceException).until(
-                    GenericECEX[WD, WE].element_located_to_be_clickable(self.locator, self.index)
-                )
-                self._cache_clickable_element(element)
-                return element
+            cached = self._cached_or_none(_PRESENT)
+            if cached is not None:
+                try:
+                    self._clickable_cache = self._visible_cache = self.waiting(timeout).until(
+                        GenericECEX[WD, WE].element_to_be_clickable(cached)
+                    )
+                    return self._clickable_cache
+                except ELEMENT_REFERENCE_EXCEPTIONS:
+                    pass
+            element = self.waiting(timeout, StaleElementReferenceException).until(
+                self._ec(GenericECEX[WD, WE].element_located_to_be_clickable)
+            )
+            if self._synced_cache:
+                self._clickable_cache = self._visible_cache = self._present_cache = element
+            return element
         except TimeoutException as exc:
             return self._timeout_process('clickable', exc, reraise)
 
@@ -714,19 +954,22 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 after the timeout(`reraise=True`).
         """
         try:
-            try:
-                return cast(
-                    WE | Literal[True],
-                    self.waiting(timeout).until(
-                        GenericECEX[WD, WE].element_to_be_unclickable(self.present_caching, present)
+            cached = self._cached_or_none(_PRESENT)
+            if cached is not None:
+                try:
+                    return cast(
+                        WE | Literal[True],
+                        self.waiting(timeout).until(
+                            GenericECEX[WD, WE].element_to_be_unclickable(cached, present)
+                        )
                     )
-                )
-            except ELEMENT_REFERENCE_EXCEPTIONS:
-                element_or_true = self.waiting(timeout, StaleElementReferenceException).until(
-                    GenericECEX[WD, WE].element_located_to_be_unclickable(self.locator, self.index, present)
-                )
-                self._cache_present_element(element_or_true)
-                return cast(WE | Literal[True], element_or_true)
+                except ELEMENT_REFERENCE_EXCEPTIONS:
+                    pass
+            element_or_true = self.waiting(timeout, StaleElementReferenceException).until(
+                self._ec(GenericECEX[WD, WE].element_located_to_be_unclickable, present)
+            )
+            self._cache_present_element(element_or_true)
+            return cast(WE | Literal[True], element_or_true)
         except TimeoutException as exc:
             return self._timeout_process('unclickable', exc, reraise, present)
 
@@ -758,16 +1001,20 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 after the timeout(`reraise=True`).
         """
         try:
-            try:
-                return self.waiting(timeout).until(
-                    GenericECEX[WD, WE].element_to_be_selected(self.present_caching)
-                )
-            except ELEMENT_REFERENCE_EXCEPTIONS:
-                element = self.waiting(timeout, StaleElementReferenceException).until(
-                    GenericECEX[WD, WE].element_located_to_be_selected(self.locator, self.index)
-                )
-                self._cache_present_element(element)
-                return element
+            cached = self._cached_or_none(_PRESENT)
+            if cached is not None:
+                try:
+                    return self.waiting(timeout).until(
+                        GenericECEX[WD, WE].element_to_be_selected(cached)
+                    )
+                except ELEMENT_REFERENCE_EXCEPTIONS:
+                    pass
+            element = self.waiting(timeout, StaleElementReferenceException).until(
+                self._ec(GenericECEX[WD, WE].element_located_to_be_selected)
+            )
+            if self._synced_cache:
+                self._present_cache = element
+            return element
         except TimeoutException as exc:
             return self._timeout_process('selected', exc, reraise)
 
@@ -799,16 +1046,20 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 after the timeout(`reraise=True`).
         """
         try:
-            try:
-                return self.waiting(timeout).until(
-                    GenericECEX[WD, WE].element_to_be_unselected(self.present_caching)
-                )
-            except ELEMENT_REFERENCE_EXCEPTIONS:
-                element = self.waiting(timeout, StaleElementReferenceException).until(
-                    GenericECEX[WD, WE].element_located_to_be_unselected(self.locator, self.index)
-                )
-                self._cache_present_element(element)
-                return element
+            cached = self._cached_or_none(_PRESENT)
+            if cached is not None:
+                try:
+                    return self.waiting(timeout).until(
+                        GenericECEX[WD, WE].element_to_be_unselected(cached)
+                    )
+                except ELEMENT_REFERENCE_EXCEPTIONS:
+                    pass
+            element = self.waiting(timeout, StaleElementReferenceException).until(
+                self._ec(GenericECEX[WD, WE].element_located_to_be_unselected)
+            )
+            if self._synced_cache:
+                self._present_cache = element
+            return element
         except TimeoutException as exc:
             return self._timeout_process('unselected', exc, reraise)
 
@@ -840,29 +1091,58 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
     @property
     def present_cache(self) -> WE | None:
         """The present element cache, `None` otherwise."""
-        return getattr(self, _Name._present_cache, None)
+        return getattr(self, _PRESENT, None)
 
     @property
     def visible_cache(self) -> WE | None:
         """The visible element cache, `None` otherwise."""
-        return getattr(self, _Name._visible_cache, None)
+        return getattr(self, _VISIBLE, None)
 
     @property
     def clickable_cache(self) -> WE | None:
         """The clickable element cache, `None` otherwise."""
-        return getattr(self, _Name._clickable_cache, None)
+        return getattr(self, _CLICKABLE, None)
 
     @property
     def select_cache(self) -> Select | None:
         """The Select instance, `None` otherwise."""
-        return getattr(self, _Name._select_cache, None)
+        return getattr(self, _SELECT, None)
 
     def is_present(self, timeout: int | float | None = None) -> bool:
         """Whether the element is present within the timeout."""
         return bool(self.wait_present(timeout, False))
 
+    def _fresh_state(self, name: str) -> bool | None:
+        """
+        The recently computed `is_visible` / `is_clickable` result,
+        or `None` if it has expired, the cached element changed,
+        or `STATE_CACHE_TTL` is disabled.
+        """
+        if STATE_CACHE_TTL <= 0:
+            return None
+        try:
+            deadline, element, result = self._state_cache[name]
+        except (AttributeError, KeyError):
+            return None
+        if time.monotonic() < deadline and element is self.present_cache:
+            return result
+        return None
+
+    def _store_state(self, name: str, element: WE, result: bool) -> None:
+        """Remember a computed state result for `STATE_CACHE_TTL` seconds."""
+        if STATE_CACHE_TTL <= 0:
+            return
+        try:
+            cache = self._state_cache
+        except AttributeError:
+            cache = self._state_cache = {}
+        cache[name] = (time.monotonic() + STATE_CACHE_TTL, element, result)
+
     def is_visible(self) -> bool:
         """Whether the element is visible (displayed)."""
+        fresh = self._fresh_state('visible')
+        if fresh is not None:
+            return fresh
         try:
             element = self.present_caching
             result = element.is_displayed()
@@ -870,56 +1150,107 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
             element = self.present_element
             result = element.is_displayed()
         self._cache_visible_element(element, result)
+        self._store_state('visible', element, result)
         return result
 
     def is_enabled(self) -> bool:
         """Whether the element is enabled."""
+        return self._with_stale_retry(lambda element: element.is_enabled())
+
+    def _clickable_state(self, element: WE) -> bool:
+        """
+        Displayed and enabled in one script round-trip.
+        Falls back to the two WebDriver calls where scripting is
+        unavailable (e.g. native app contexts); a stale element still
+        propagates so the caller can relocate.
+        """
         try:
-            return self.present_caching.is_enabled()
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            return self.present_element.is_enabled()
+            displayed, enabled = self.driver.execute_script(_CLICKABLE_STATE_SCRIPT, element)
+            return bool(displayed and enabled)
+        except StaleElementReferenceException:
+            raise
+        except WebDriverException:
+            return element.is_displayed() and element.is_enabled()
 
     def is_clickable(self) -> bool:
         """Whether the element is clickable (displayed and enabled)."""
+        fresh = self._fresh_state('clickable')
+        if fresh is not None:
+            return fresh
         try:
             element = self.present_caching
-            result = element.is_displayed() and element.is_enabled()
+            result = self._clickable_state(element)
         except ELEMENT_REFERENCE_EXCEPTIONS:
             element = self.present_element
-            result = element.is_displayed() and element.is_enabled()
+            result = self._clickable_state(element)
         self._cache_clickable_element(element, result)
+        self._store_state('clickable', element, result)
         return result
 
     def is_selected(self) -> bool:
         """Whether the element is selected."""
-        try:
-            return self.present_caching.is_selected()
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            return self.present_element.is_selected()
+        return self._with_stale_retry(lambda element: element.is_selected())
 
     @property
     def text(self) -> str:
         """The text of the element when it is present."""
-        try:
-            return self.present_caching.text
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            return self.present_element.text
+        return self._with_stale_retry(lambda element: element.text)
 
     @property
     def visible_text(self) -> str:
         """The text of the element when it is visible."""
-        try:
-            return self.visible_caching.text
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            return self.visible_element.text
+        return self._with_visible_stale_retry(lambda element: element.text)
 
     @property
     def tag_name(self) -> str:
         """The tagName property."""
+        return self._with_stale_retry(lambda element: element.tag_name)
+
+    def _fetch_rect(self) -> dict:
+        """
+        The raw element rect from one driver round-trip, shared by the
+        geometry properties and reused within `RECT_CACHE_TTL` seconds,
+        so chained reads like `center` followed by `border` cost a
+        single call.
+        """
+        now = time.monotonic()
         try:
-            return self.present_caching.tag_name
+            deadline, rect = self._rect_cache
+            if now < deadline:
+                return rect
+        except AttributeError:
+            pass
+        try:
+            rect = self.present_caching.rect
         except ELEMENT_REFERENCE_EXCEPTIONS:
-            return self.present_element.tag_name
+            rect = self.present_element.rect
+        self._rect_cache = (now + RECT_CACHE_TTL, rect)
+        return rect
+
+    @contextmanager
+    def geometry_batch(self) -> Iterator[dict]:
+        """
+        Pin the element rect for the duration of the block, so every
+        geometry read inside derives from exactly one driver round-trip.
+
+        Examples:
+            ::
+
+                with page.element.geometry_batch():
+                    center = page.element.center
+                    border = page.element.border
+
+        """
+        rect = self._fetch_rect()
+        self._rect_cache = (float('inf'), rect)
+        try:
+            # Yield a copy; the pinned cache object stays private.
+            yield dict(rect)
+        finally:
+            try:
+                del self._rect_cache
+            except AttributeError:
+                pass
 
     @property
     def rect(self) -> dict:
@@ -927,17 +1258,9 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         The location and size of the element.
         For example: `{'x': 10, 'y': 15, 'width': 100, 'height': 200}`.
         """
-        try:
-            rect = self.present_caching.rect
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            rect = self.present_element.rect
-        # rearranged
-        return {
-            'x': rect['x'],
-            'y': rect['y'],
-            'width': rect['width'],
-            'height': rect['height']
-        }
+        # Copy so callers mutating the result cannot corrupt the cache
+        # shared with `location`, `size`, `border` and `center`.
+        return dict(self._fetch_rect())
 
     @property
     def location(self) -> dict:
@@ -945,10 +1268,8 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         The location of the element when it is in the renderable canvas.
         For example: `{'x': 200, 'y': 300}`.
         """
-        try:
-            return self.present_caching.location
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            return self.present_element.location
+        rect = self._fetch_rect()
+        return {'x': rect['x'], 'y': rect['y']}
 
     @property
     def location_once_scrolled_into_view(self) -> dict:
@@ -961,10 +1282,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         Returns the top-left corner coordinates on the screen,
         or `(0, 0)` if the element is not visible.
         """
-        try:
-            return self.present_caching.location_once_scrolled_into_view
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            return self.present_element.location_once_scrolled_into_view
+        return self._with_stale_retry(lambda element: element.location_once_scrolled_into_view)
 
     @property
     def size(self) -> dict:
@@ -972,14 +1290,10 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         The size of the element.
         For example: `{'width': 200, 'height': 100}`.
         """
-        try:
-            size = self.present_caching.size
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            size = self.present_element.size
-        # rearranged
+        rect = self._fetch_rect()
         return {
-            'width': size['width'],
-            'height': size['height']
+            'width': rect['width'],
+            'height': rect['height']
         }
 
     @property
@@ -988,15 +1302,13 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         The border of the element.
         For example: `{'left': 150, 'right': 250, 'top': 200, 'bottom': 400}`.
         """
-        try:
-            rect = self.present_caching.rect
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            rect = self.present_element.rect
+        rect = self._fetch_rect()
+        x, y, w, h = rect['x'], rect['y'], rect['width'], rect['height']
         return {
-            'left': int(rect['x']),
-            'right': int(rect['x'] + rect['width']),
-            'top': int(rect['y']),
-            'bottom': int(rect['y'] + rect['height'])
+            'left': int(x),
+            'right': int(x + w),
+            'top': int(y),
+            'bottom': int(y + h)
         }
 
     @property
@@ -1005,13 +1317,11 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         The center location of the element.
         For example: `{'x': 80, 'y': 190}`.
         """
-        try:
-            rect = self.present_caching.rect
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            rect = self.present_element.rect
+        rect = self._fetch_rect()
+        x, y, w, h = rect['x'], rect['y'], rect['width'], rect['height']
         return {
-            'x': int(rect['x'] + rect['width'] / 2),
-            'y': int(rect['y'] + rect['height'] / 2)
+            'x': int(x + w / 2),
+            'y': int(y + h / 2)
         }
 
     @property
@@ -1021,26 +1331,17 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         Only works from Chromium 96, Firefox 96, and Safari 16.4 onwards.
         If no shadow root was attached, raises `NoSuchShadowRoot`.
         """
-        try:
-            return self.present_caching.shadow_root
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            return self.present_element.shadow_root
+        return self._with_stale_retry(lambda element: element.shadow_root)
 
     @property
     def aria_role(self) -> str:
         """The ARIA role of the current web element."""
-        try:
-            return self.present_caching.aria_role
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            return self.present_element.aria_role
+        return self._with_stale_retry(lambda element: element.aria_role)
 
     @property
     def accessible_name(self) -> str:
         """The ARIA Level of the current web element."""
-        try:
-            return self.present_caching.accessible_name
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            return self.present_element.accessible_name
+        return self._with_stale_retry(lambda element: element.accessible_name)
 
     def get_dom_attribute(self, name: str) -> str:
         """
@@ -1057,10 +1358,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 text_length = element.get_dom_attribute("class")
 
         """
-        try:
-            return self.present_caching.get_dom_attribute(name)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            return self.present_element.get_dom_attribute(name)
+        return self._with_stale_retry(lambda element: element.get_dom_attribute(name))
 
     def get_attribute(self, name: str) -> str | dict | None:
         """
@@ -1088,10 +1386,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 is_active = "active" in target_element.get_attribute("class")
 
         """
-        try:
-            return self.present_caching.get_attribute(name)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            return self.present_element.get_attribute(name)
+        return self._with_stale_retry(lambda element: element.get_attribute(name))
 
     def get_property(self, name: Any) -> str | bool | dict | WE:
         """
@@ -1121,10 +1416,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 page.element.value_of_css_property('color')
 
         """
-        try:
-            return self.present_caching.value_of_css_property(property_name)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            return self.present_element.value_of_css_property(property_name)
+        return self._with_stale_retry(lambda element: element.value_of_css_property(property_name))
 
     def visible_value_of_css_property(self, property_name: Any) -> str:
         """
@@ -1136,23 +1428,27 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 page.element.visible_value_of_css_property('color')
 
         """
-        try:
-            return self.visible_caching.value_of_css_property(property_name)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            return self.visible_element.value_of_css_property(property_name)
+        return self._with_visible_stale_retry(lambda element: element.value_of_css_property(property_name))
 
     def click(self) -> None:
         """Click the element when it is clickable."""
-        try:
-            self.clickable_caching.click()
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.clickable_element.click()
+        self._with_clickable_stale_retry(lambda element: element.click())
 
-    def delayed_click(self, sleep: int | float = 0.5) -> None:
+    def delayed_click(self, sleep: int | float = 0.5, server_side: bool = False) -> None:
         """
         Clicks the element after it becomes clickable,
         with a specified delay (sleep) in seconds.
+        If `server_side` is `True`, the delay is queued as a W3C Actions
+        pause and the driver executes pause and click in one round-trip,
+        without blocking the Python thread in between.
         """
+        if server_side:
+            try:
+                element = self.clickable_caching
+            except ELEMENT_REFERENCE_EXCEPTIONS:
+                element = self.clickable_element
+            self.action.pause(sleep).click(element).perform()
+            return
         try:
             cache = self.clickable_caching
             time.sleep(sleep)
@@ -1173,10 +1469,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 my_page.my_element.clear().send_keys('my text')
 
         """
-        try:
-            self.clickable_caching.clear()
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.clickable_element.clear()
+        self._with_clickable_stale_retry(lambda element: element.clear())
         return self
 
     def send_keys(self, *value) -> Self:
@@ -1194,18 +1487,12 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 my_page.my_element.click().clear().send_keys('my_text')
 
         """
-        try:
-            self.clickable_caching.send_keys(*value)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.clickable_element.send_keys(*value)
+        self._with_clickable_stale_retry(lambda element: element.send_keys(*value))
         return self
 
     def submit(self) -> None:
         """Submits a form."""
-        try:
-            self.present_caching.submit()
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.present_element.submit()
+        self._with_stale_retry(lambda element: element.submit())
 
     def switch_to_frame(
         self,
@@ -1229,10 +1516,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
             filename: The **full path** you wish to save your screenshot to.
                 This should end with a `.png` extension.
         """
-        try:
-            return self.present_caching.screenshot(filename)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            return self.present_element.screenshot(filename)
+        return self._with_stale_retry(lambda element: element.screenshot(filename))
 
     def perform(self) -> None:
         """
@@ -1293,10 +1577,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 page.element.move_to_element().clicks().perform()
 
         """
-        try:
-            self.action.click(self.present_caching)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.action.click(self.present_element)
+        self.action.click(self._resolve_present())
         return self
 
     def clicks(self) -> Self:
@@ -1331,10 +1612,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 page.element.move_to_element().click_and_hold().perform()
 
         """
-        try:
-            self.action.click_and_hold(self.present_caching)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.action.click_and_hold(self.present_element)
+        self.action.click_and_hold(self._resolve_present())
         return self
 
     def click_and_hold(self) -> Self:
@@ -1369,10 +1647,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 page.element.move_to_element().context_click().perform()
 
         """
-        try:
-            self.action.context_click(self.present_caching)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.action.context_click(self.present_element)
+        self.action.context_click(self._resolve_present())
         return self
 
     def context_click(self) -> Self:
@@ -1406,10 +1681,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 page.element.move_to_element().double_click().perform()
 
         """
-        try:
-            self.action.double_click(self.present_caching)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.action.double_click(self.present_element)
+        self.action.double_click(self._resolve_present())
         return self
 
     def double_click(self) -> Self:
@@ -1441,10 +1713,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 page.element1.drag_and_drop(page.element2).perform()
 
         """
-        try:
-            self.action.drag_and_drop(self.present_caching, target.present_caching)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.action.drag_and_drop(self.present_element, target.present_element)
+        self.action.drag_and_drop(self._resolve_present(), target._resolve_present())
         return self
 
     def drag_and_drop_by_offset(self, xoffset: int, yoffset: int) -> Self:
@@ -1463,12 +1732,36 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 page.element.drag_and_drop_by_offset(100, 200).perform()
 
         """
-        try:
-            self.action.drag_and_drop_by_offset(self.present_caching, xoffset, yoffset)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.action.drag_and_drop_by_offset(self.present_element, xoffset, yoffset)
+        self.action.drag_and_drop_by_offset(self._resolve_present(), xoffset, yoffset)
         return self
 
+    @staticmethod
+    def _queue_hotkey(action: ActionChains, keys: tuple[str, ...]) -> None:
+        """
+        Queue a hotkey sequence straight onto the W3C key source:
+        hold every key but the last, type the last, then release in
+        reverse order. Emits the same payload as the equivalent
+        `key_down`/`send_keys`/`key_up` chain, with the per-key wrapper
+        calls collapsed into one loop over bound input sources.
+        """
+        key_action = action.w3c_actions.key_action
+        key_down = key_action.key_down
+        key_up = key_action.key_up
+        # ActionChains pads the pointer source per key action to keep
+        # the two timelines aligned; do the same.
+        pointer_pause = action.w3c_actions.pointer_action.pause
+        for key in keys[:-1]:
+            key_down(key)
+            pointer_pause()
+        for key in keys_to_typing((keys[-1],)):
+            key_down(key)
+            pointer_pause()
+            key_up(key)
+            pointer_pause()
+        for key in keys[-2::-1]:
+            key_up(key)
+            pointer_pause()
+
     def send_hotkey_to_element(self, *keys: str) -> Self:
         """
         ActionChains API.
@@ -1481,19 +1774,9 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 page.element2.send_hotkey_to_element(Keys.CONTROL, 'v').perform()
 
         """
-        # key_down: The first key.
-        try:
-            self.action.key_down(keys[0], self.present_caching)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.action.key_down(keys[0], self.present_element)
-        # key_down: Intermediate keys (excluding first and last).
-        for key in keys[1:-1]:  # ignored if only 2 keys
-            self.action.key_down(key)
-        # send_keys: The last key.
-        self.action.send_keys(keys[-1])
-        # key_up: All keys except the last, in reverse order.
-        for key in keys[-2::-1]:
-            self.action.key_up(key)
+        action = self.action  # bound once for the whole sequence
+        action.click(self._resolve_present())
+        self._queue_hotkey(action, keys)
         return self
 
     def send_hotkey(self, *keys: str) -> Self:
@@ -1509,14 +1792,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 page.element2.send_hotkey_to_element(Keys.CONTROL, 'v').perform()
 
         """
-        # key_down: The first to the second last key.
-        for key in keys[:-1]:
-            self.action.key_down(key)
-        # send_keys: The last key.
-        self.action.send_keys(keys[-1])
-        # key_up: The second last key to the first key.
-        for key in keys[-2::-1]:
-            self.action.key_up(key)
+        self._queue_hotkey(self.action, keys)
         return self
 
     def key_down_to_element(self, key: str) -> Self:
@@ -1538,10 +1814,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 page.element.send_hotkey_to_element(Key.CONTROL, 'a').send_hotkey(Keys.CONTROL, 'c').perform()
 
         """
-        try:
-            self.action.key_down(key, self.present_caching)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.action.key_down(key, self.present_element)
+        self.action.key_down(key, self._resolve_present())
         return self
 
     def key_down(self, key: str) -> Self:
@@ -1585,10 +1858,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 page.element.send_hotkey_to_element(Key.CONTROL, 'a').send_hotkey(Keys.CONTROL, 'c').perform()
 
         """
-        try:
-            self.action.key_up(key, self.present_caching)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.action.key_up(key, self.present_element)
+        self.action.key_up(key, self._resolve_present())
         return self
 
     def key_up(self, key: str) -> Self:
@@ -1642,10 +1912,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 page.element.scroll_to_element().move_to_element().perform()
 
         """
-        try:
-            self.action.move_to_element(self.present_caching)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.action.move_to_element(self.present_element)
+        self.action.move_to_element(self._resolve_present())
         return self
 
     def move_to_element_with_offset(self, xoffset: int, yoffset: int) -> Self:
@@ -1664,10 +1931,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 page.element.scroll_to_element().move_to_element_with_offset(100, 200).perform()
 
         """
-        try:
-            self.action.move_to_element_with_offset(self.present_caching, xoffset, yoffset)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.action.move_to_element_with_offset(self.present_element, xoffset, yoffset)
+        self.action.move_to_element_with_offset(self._resolve_present(), xoffset, yoffset)
         return self
 
     def pause(self, seconds: int | float) -> Self:
@@ -1689,10 +1953,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 page.element.release_on_element().perform()
 
         """
-        try:
-            self.action.release(self.present_caching)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.action.release(self.present_element)
+        self.action.release(self._resolve_present())
         return self
 
     def release(self) -> Self:
@@ -1720,10 +1981,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 page.element.sends_keys_to_element('some text', Keys.ENTER)
 
         """
-        try:
-            self.action.send_keys_to_element(self.present_caching, *keys)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.action.send_keys_to_element(self.present_element, *keys)
+        self.action.send_keys_to_element(self._resolve_present(), *keys)
         return self
 
     def sends_keys(self, *keys: str) -> Self:
@@ -1753,10 +2011,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 page.element.scroll_to_element().clicks().perform()
 
         """
-        try:
-            self.action.scroll_to_element(self.present_caching)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.action.scroll_to_element(self.present_element)
+        self.action.scroll_to_element(self._resolve_present())
         return self
 
     def scroll_by_amount(self, delta_x: int, delta_y: int) -> Self:
@@ -1810,12 +2065,16 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 page.element.scroll_from_element(-30, -50, 150, 100).clicks().perform()
 
         """
+        element = self._resolve_present()
+        key = (element, x_offset, y_offset)
         try:
-            scroll_origin = ScrollOrigin.from_element(self.present_caching, x_offset, y_offset)
-            self.action.scroll_from_origin(scroll_origin, delta_x, delta_y)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            scroll_origin = ScrollOrigin.from_element(self.present_element, x_offset, y_offset)
-            self.action.scroll_from_origin(scroll_origin, delta_x, delta_y)
+            cached_key, scroll_origin = self._scroll_origin_cache
+            if cached_key != key:
+                raise AttributeError
+        except AttributeError:
+            scroll_origin = ScrollOrigin.from_element(element, x_offset, y_offset)
+            self._scroll_origin_cache = (key, scroll_origin)
+        self.action.scroll_from_origin(scroll_origin, delta_x, delta_y)
         return self
 
     def scroll_from_origin(
@@ -1858,10 +2117,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         Select API.
         Returns a list of all options belonging to this select tag.
         """
-        try:
-            return cast(list[WE], self.select_caching.options)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            return cast(list[WE], self.select.options)
+        return self._with_select_stale_retry(lambda select: cast(list[WE], select.options))
 
     @property
     def all_selected_options(self) -> list[WE]:
@@ -1869,10 +2125,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         Select API.
         Returns a list of all selected options belonging to this select tag.
         """
-        try:
-            return cast(list[WE], self.select_caching.all_selected_options)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            return cast(list[WE], self.select.all_selected_options)
+        return self._with_select_stale_retry(lambda select: cast(list[WE], select.all_selected_options))
 
     @property
     def first_selected_option(self) -> WE:
@@ -1881,10 +2134,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         The first selected option in this select tag,
         or the currently selected option in a normal select.
         """
-        try:
-            return cast(WE, self.select_caching.first_selected_option)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            return cast(WE, self.select.first_selected_option)
+        return self._with_select_stale_retry(lambda select: cast(WE, select.first_selected_option))
 
     def select_by_value(self, value: str) -> None:
         """
@@ -1897,10 +2147,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         Args:
             value: The value to match against.
         """
-        try:
-            self.select_caching.select_by_value(value)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.select.select_by_value(value)
+        self._with_select_stale_retry(lambda select: select.select_by_value(value))
 
     def select_by_index(self, index: int) -> None:
         """
@@ -1915,10 +2162,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 throws `NoSuchElementException` if there is no option
                 with specified index in SELECT.
         """
-        try:
-            self.select_caching.select_by_index(index)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.select.select_by_index(index)
+        self._with_select_stale_retry(lambda select: select.select_by_index(index))
 
     def select_by_visible_text(self, text: str) -> None:
         """
@@ -1933,20 +2177,14 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
                 throws `NoSuchElementException` if there is no option
                 with specified text in SELECT.
         """
-        try:
-            self.select_caching.select_by_visible_text(text)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.select.select_by_visible_text(text)
+        self._with_select_stale_retry(lambda select: select.select_by_visible_text(text))
 
     def deselect_all(self) -> None:
         """
         Select API. Clear all selected entries.
         This is only valid when the SELECT supports multiple selections.
         """
-        try:
-            self.select_caching.deselect_all()
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.select.deselect_all()
+        self._with_select_stale_retry(lambda select: select.deselect_all())
 
     def deselect_by_value(self, value: str) -> None:
         """
@@ -1958,10 +2196,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         Args:
             value: The value to match against.
         """
-        try:
-            self.select_caching.deselect_by_value(value)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.select.deselect_by_value(value)
+        self._with_select_stale_retry(lambda select: select.deselect_by_value(value))
 
     def deselect_by_index(self, index: int) -> None:
         """
@@ -1973,10 +2208,7 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         Args:
             index: The option at this index will be deselected.
         """
-        try:
-            self.select_caching.deselect_by_index(index)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.select.deselect_by_index(index)
+        self._with_select_stale_retry(lambda select: select.deselect_by_index(index))
 
     def deselect_by_visible_text(self, text: str) -> None:
         """
@@ -1988,11 +2220,9 @@ class GenericElement[WD: WebDriver, WE: WebElement]:
         Args:
             text: The visible text to match against.
         """
-        try:
-            self.select_caching.deselect_by_visible_text(text)
-        except ELEMENT_REFERENCE_EXCEPTIONS:
-            self.select.deselect_by_visible_text(text)
+        self._with_select_stale_retry(lambda select: select.deselect_by_visible_text(text))
 
 
 class Element(GenericElement[WebDriver, WebElement]):
-    pass
+
+    __slots__ = ()
@@ -13,16 +13,16 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, cast, Iterable, Literal, Self, Type
+from typing import Any, Callable, cast, Iterable, Literal, Self, Type
 
-from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
 from selenium.webdriver.remote.shadowroot import ShadowRoot
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 from ..logging import LogConfig, PageElementLoggerAdapter
 from ..wait import Wait
-from ..common import _Name
+from ..common import DEBUG, _INT_FLOAT_OR_NONE, _STR_OR_NONE, _Name
 from .by import ByAttr
 from .ecex import GenericECEX
 from .page import GenericPage
@@ -31,9 +31,29 @@ from .page import GenericPage
 LOGGER = logging.getLogger(__name__)
 LOGGER.addFilter(LogConfig.PREFIX_FILTER)
 
+# Module-level binding of the page attribute name, so the descriptor
+# hot path loads it with LOAD_GLOBAL instead of a class attribute lookup.
+_PAGE = _Name._page
+
+_DISPLAYED_STATE_SCRIPT = (
+    'return arguments[0].map(function (e) {'
+    'var s = window.getComputedStyle(e);'
+    'return !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length)'
+    " && s.visibility === 'visible' && parseFloat(s.opacity) !== 0;"
+    '});'
+)
+"""
+One-round-trip displayedness check for a list of elements. The layout
+check is combined with computed visibility and opacity to match the
+per-element `is_displayed()` atom for hidden and fully transparent
+elements.
+"""
+
 
 class GenericElements[WD: WebDriver, WE: WebElement]:
 
+    __slots__ = ('_by', '_value', '_locator', '_timeout', '_remark', '_logger', '_page', '_wait', '_ec_cache')
+
     _page: GenericPage[WD, WE]
     _wait: Wait
 
@@ -61,8 +81,10 @@ class GenericElements[WD: WebDriver, WE: WebElement]:
 
     def __get__(self, instance: GenericPage[WD, WE], owner: Type[GenericPage[WD, WE]]) -> Self:
         """Make "Elements" a descriptor of "Page"."""
+        if instance is None:
+            return self
         self._verify_get(instance, owner)
-        if getattr(self, _Name._page, None) is not instance:
+        if getattr(self, _PAGE, None) is not instance:
             self._page = instance
             self._wait = Wait(instance._driver, 1)
         self._sync_data()
@@ -113,6 +135,21 @@ class GenericElements[WD: WebDriver, WE: WebElement]:
         """
         # Avoid using __init__() here, as it will reset the descriptor.
         self._verify_data(by, value, timeout, remark)
+        return self._dynamic_unchecked(by, value, timeout, remark)
+
+    def _dynamic_unchecked(
+        self,
+        by: str,
+        value: str,
+        timeout: int | float | None = None,
+        remark: str | None = None
+    ) -> Self:
+        """
+        `dynamic()` without re-validating the args.
+        For framework code that rebuilds elements in bulk from values
+        already known to be well-typed; all other callers should use
+        `dynamic()`.
+        """
         self._set_data(by, value, timeout, remark)
         self._sync_data()
         return self
@@ -124,11 +161,14 @@ class GenericElements[WD: WebDriver, WE: WebElement]:
         timeout: int | float | None,
         remark: str | None
     ) -> None:
-        """Verify basic attributes."""
+        """Verify basic attributes with all checks inlined in one frame."""
         self._verify_by(by)
-        self._verify_value(value)
-        self._verify_timeout(timeout)
-        self._verify_remark(remark)
+        if not isinstance(value, _STR_OR_NONE):
+            raise TypeError(f'The set "value" must be str, got {type(value).__name__}.')
+        if not isinstance(timeout, _INT_FLOAT_OR_NONE):
+            raise TypeError(f'The set "timeout" must be int or float, got {type(timeout).__name__}.')
+        if not isinstance(remark, _STR_OR_NONE):
+            raise TypeError(f'The set "remark" must be str, got {type(remark).__name__}.')
 
     def _set_data(
         self,
@@ -140,36 +180,67 @@ class GenericElements[WD: WebDriver, WE: WebElement]:
         """Set basic attributes."""
         self._by = by
         self._value = value
+        self._locator = (by, value) if by and value else None
         self._timeout = timeout
-        self._remark = remark or self.default_remark
-        self._logger = PageElementLoggerAdapter(LOGGER, self)
+        self._remark = remark or None
+        for lazy in ('_logger', '_ec_cache'):
+            try:
+                delattr(self, lazy)
+            except AttributeError:
+                pass
 
     def _sync_data(self) -> None:
         """Synchronize necessary attributes."""
-        self._wait.timeout = self._page._timeout if self._timeout is None else self._timeout
+        # Runs on every descriptor access; both values are already
+        # validated, so skip the property dispatch and write only on change.
+        timeout = self._page._timeout if self._timeout is None else self._timeout
+        if self._wait._timeout != timeout:
+            self._wait._timeout = timeout
 
-    def _verify_by(self, by: Any) -> None:
-        if by not in ByAttr.OPTIONAL_VALUES:
+    def _ec(self, factory: Callable[..., Callable]) -> Callable:
+        """
+        Return the cached predicate built by `factory(self.locator)`,
+        building it on first use. Locator-based predicates close only
+        over the locator, so they can be reused across waits; `_set_data`
+        drops the cache whenever the locator data changes.
+        """
+        try:
+            cache = self._ec_cache
+        except AttributeError:
+            cache = self._ec_cache = {}
+        name = factory.__name__
+        predicate = cache.get(name)
+        if predicate is None:
+            predicate = cache[name] = factory(self.locator)
+        return predicate
+
+    def _verify_by(self, by: Any, _valid: frozenset = ByAttr.OPTIONAL_VALUES_SET) -> None:
+        # `_valid` is bound at definition time for LOAD_FAST membership checks.
+        if by not in _valid:
             raise ValueError(f'Invalid "by": "{by}". Use values from "By" (from huskium.selenium import By).')
 
-    def _verify_value(self, value: Any) -> None:
-        if not isinstance(value, str | None):
-            raise TypeError(f'The set "value" must be str, got {type(value).__name__}.')
-
     def _verify_timeout(self, timeout: Any) -> None:
-        if not isinstance(timeout, int | float | None):
+        if not isinstance(timeout, _INT_FLOAT_OR_NONE):
             raise TypeError(f'The set "timeout" must be int or float, got {type(timeout).__name__}.')
 
     def _verify_remark(self, remark: Any) -> None:
-        if not isinstance(remark, str | None):
+        if not isinstance(remark, _STR_OR_NONE):
             raise TypeError(f'The set "remark" must be str, got {type(remark).__name__}.')
 
-    def _verify_get(self, instance: Any, owner: Any):
-        self._verify_descriptor_instance(instance)
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Validate the owning class once, at class creation time."""
         self._verify_descriptor_owner(owner)
 
+    def _verify_get(self, instance: Any, owner: Any):
+        # The owner is already validated by `__set_name__`; re-check the
+        # instance and owner per access only when `HUSKIUM_DEBUG=1`.
+        if DEBUG:
+            self._verify_descriptor_instance(instance)
+            self._verify_descriptor_owner(owner)
+
     def _verify_set(self, instance: Any, value: Any):
-        self._verify_descriptor_instance(instance)
+        if DEBUG:
+            self._verify_descriptor_instance(instance)
         self._verify_descriptor_value(value)
 
     def _verify_descriptor_instance(self, instance: Any) -> None:
@@ -200,9 +271,9 @@ class GenericElements[WD: WebDriver, WE: WebElement]:
 
     @property
     def locator(self) -> tuple[str, str]:
-        """The elements locator `(by, value)`"""
-        if self._by and self._value:
-            return (self._by, self._value)
+        """The elements locator `(by, value)`, built once at set time."""
+        if self._locator:
+            return self._locator
         raise ValueError('The locator "(by, value)" must be set.')
 
     @property
@@ -219,8 +290,11 @@ class GenericElements[WD: WebDriver, WE: WebElement]:
     def remark(self) -> str | dict:
         """
         The elements remark.
-        If not set, defaults to ``{"by": by, "value": value}``.
+        If not set, defaults to ``{"by": by, "value": value}``,
+        built on first access.
         """
+        if self._remark is None:
+            self._remark = self.default_remark
         return self._remark
 
     @property
@@ -234,12 +308,16 @@ class GenericElements[WD: WebDriver, WE: WebElement]:
         defaults to ``{"by": by, "value": value}``.
         """
         self._verify_remark(value)
-        self._remark = value or self.default_remark
+        self._remark = value or None
 
     @property
     def logger(self) -> PageElementLoggerAdapter:
-        """The elements logger."""
-        return self._logger
+        """The elements logger, built on first use."""
+        try:
+            return self._logger
+        except AttributeError:
+            self._logger = PageElementLoggerAdapter(LOGGER, self)
+            return self._logger
 
     @property
     def page(self) -> GenericPage[WD, WE]:
@@ -348,7 +426,7 @@ class GenericElements[WD: WebDriver, WE: WebElement]:
         """
         try:
             return self.waiting(timeout).until(
-                GenericECEX[WD, WE].presence_of_all_elements_located(self.locator)
+                self._ec(GenericECEX[WD, WE].presence_of_all_elements_located)
             )
         except TimeoutException as exc:
             return self._timeout_process('all present', exc, reraise)
@@ -381,7 +459,7 @@ class GenericElements[WD: WebDriver, WE: WebElement]:
         """
         try:
             return self.waiting(timeout).until(
-                GenericECEX[WD, WE].absence_of_all_elements_located(self.locator)
+                self._ec(GenericECEX[WD, WE].absence_of_all_elements_located)
             )
         except TimeoutException as exc:
             return self._timeout_process('all absent', exc, reraise)
@@ -415,7 +493,7 @@ class GenericElements[WD: WebDriver, WE: WebElement]:
         """
         try:
             return self.waiting(timeout, StaleElementReferenceException).until(
-                GenericECEX[WD, WE].visibility_of_all_elements_located(self.locator)
+                self._ec(GenericECEX[WD, WE].visibility_of_all_elements_located)
             )
         except TimeoutException as exc:
             return self._timeout_process('all visible', exc, reraise)
@@ -449,7 +527,7 @@ class GenericElements[WD: WebDriver, WE: WebElement]:
         """
         try:
             return self.waiting(timeout, StaleElementReferenceException).until(
-                GenericECEX[WD, WE].visibility_of_any_elements_located(self.locator)
+                self._ec(GenericECEX[WD, WE].visibility_of_any_elements_located)
             )
         except TimeoutException as exc:
             return self._timeout_process('any visible', exc, reraise)
@@ -482,6 +560,21 @@ class GenericElements[WD: WebDriver, WE: WebElement]:
         """
         return bool(self.wait_all_present(timeout, False))
 
+    def _bulk_displayed(self, elements: list[WE]) -> list[bool]:
+        """
+        The displayed state of each element in one driver round-trip,
+        falling back to per-element `is_displayed()` calls when the
+        driver rejects script execution.
+        """
+        if not elements:
+            return []
+        try:
+            return self.driver.execute_script(_DISPLAYED_STATE_SCRIPT, elements)
+        except StaleElementReferenceException:
+            raise
+        except WebDriverException:
+            return [element.is_displayed() for element in elements]
+
     def are_all_visible(self) -> bool:
         """
         Whether all elements are visible.
@@ -490,7 +583,7 @@ class GenericElements[WD: WebDriver, WE: WebElement]:
             bool:
                 `True` if all are visible within the timeout, `False` otherwise.
         """
-        return all(element.is_displayed() for element in self.all_present_elements)
+        return all(self._bulk_displayed(self.all_present_elements))
 
     def are_any_visible(self) -> bool:
         """
@@ -501,7 +594,7 @@ class GenericElements[WD: WebDriver, WE: WebElement]:
                 `True` if at least one is visible within the timeout,
                 `False` otherwise.
         """
-        return any(element.is_displayed() for element in self.all_present_elements)
+        return any(self._bulk_displayed(self.all_present_elements))
 
     @property
     def quantity(self) -> int:
@@ -526,16 +619,7 @@ class GenericElements[WD: WebDriver, WE: WebElement]:
     @property
     def rects(self) -> list[dict[str, int]]:
         """The rects of all present elements."""
-        return [
-            {
-                'x': rect['x'],
-                'y': rect['y'],
-                'width': rect['width'],
-                'height': rect['height']
-            }
-            for element in self.all_present_elements
-            for rect in [element.rect]
-        ]
+        return [element.rect for element in self.all_present_elements]
 
     @property
     def locations(self) -> list[dict[str, int]]:
@@ -545,14 +629,7 @@ class GenericElements[WD: WebDriver, WE: WebElement]:
     @property
     def sizes(self) -> list[dict]:
         """The sizes of all present elements."""
-        return [
-            {
-                'width': size['width'],
-                'height': size['height']
-            }
-            for element in self.all_present_elements
-            for size in [element.size]
-        ]
+        return [element.size for element in self.all_present_elements]
 
     @property
     def centers(self) -> list[dict]:
@@ -615,4 +692,5 @@ class GenericElements[WD: WebDriver, WE: WebElement]:
 
 
 class Elements(GenericElements[WebDriver, WebElement]):
-    pass
+
+    __slots__ = ()
@@ -23,6 +23,7 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as ec
 from appium.webdriver.webdriver import WebDriver as AppiumWebDriver
 
+from ..common import _INT_FLOAT
 from ..logging import LogConfig, PageElementLoggerAdapter
 from ..wait import Wait
 
@@ -77,7 +78,7 @@ class GenericPage[WD: WebDriver, WE: WebElement]:
             raise TypeError('The "driver" must be "selenium WebDriver", got "appium WebDriver".')
 
     def _verify_timeout(self, timeout: Any) -> None:
-        if not isinstance(timeout, int | float):
+        if not isinstance(timeout, _INT_FLOAT):
             raise TypeError(f'The "timeout" must be "int" or "float", got {type(timeout).__name__}.')
 
     def _verify_reraise(self, reraise: Any) -> None:
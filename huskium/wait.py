@@ -6,26 +6,48 @@
 
 from typing import Iterable, Type
 
-from selenium.webdriver.support.wait import IGNORED_EXCEPTIONS, WebDriverWait
+from selenium.webdriver.support.wait import IGNORED_EXCEPTIONS, POLL_FREQUENCY, WebDriverWait
+
+from .common import _INT_FLOAT
 
 
 class Wait(WebDriverWait):
     """
-    Extended WebDriverWait with customizable timeout and ignored_exceptions.
+    Extended WebDriverWait with customizable timeout, poll_frequency
+    and ignored_exceptions.
+    The setters skip the write when the value is unchanged, so the
+    per-wait synchronization in `waiting()` and `_sync_data()` costs
+    nothing in the common case.
     """
 
+    _ignored_raw = None
+    """The last non-None value accepted by the `ignored_exceptions` setter."""
+
     @property
     def timeout(self):
         return self._timeout
 
     @timeout.setter
     def timeout(self, value: int | float | None):
-        if value is None:
+        if value is None or value == self._timeout:
             return
-        if not isinstance(value, int | float):
+        if not isinstance(value, _INT_FLOAT):
             raise TypeError(f'The "timeout" must be int or float, got {type(value).__name__}')
         self._timeout = value
 
+    @property
+    def poll_frequency(self):
+        return self._poll
+
+    @poll_frequency.setter
+    def poll_frequency(self, value: int | float | None):
+        if value is None:
+            self._poll = POLL_FREQUENCY
+            return
+        if not isinstance(value, _INT_FLOAT):
+            raise TypeError(f'The "poll_frequency" must be int or float, got {type(value).__name__}')
+        self._poll = value
+
     @property
     def ignored_exceptions(self):
         return self._ignored_exceptions
@@ -33,8 +55,14 @@ class Wait(WebDriverWait):
     @ignored_exceptions.setter
     def ignored_exceptions(self, value: Type[Exception] | Iterable[Type[Exception]] | None):
         if value is None:
-            self._ignored_exceptions = IGNORED_EXCEPTIONS
+            if self._ignored_exceptions is not IGNORED_EXCEPTIONS:
+                self._ignored_exceptions = IGNORED_EXCEPTIONS
+            self._ignored_raw = None
+            return
+        if value is self._ignored_raw:
+            # Already validated and applied on this instance.
             return
+        raw = value
         if isinstance(value, type) and issubclass(value, Exception):
             value = (value,)
         elif not (
@@ -46,3 +74,4 @@ class Wait(WebDriverWait):
                 f'got {type(value).__name__}.'
             )
         self._ignored_exceptions = IGNORED_EXCEPTIONS + tuple(value)
+        self._ignored_raw = raw